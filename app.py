@@ -1,8 +1,58 @@
 import streamlit as st
-import sympy as sp
-import matplotlib.pyplot as plt
-import numpy as np
+import os
 import random
+import uuid
+
+# sympy, numpy e matplotlib são importados dentro das páginas que os usam, para que
+# o início do app (e páginas como Teoria e Exercícios) não pague esse custo.
+from binomio.cache_figuras import cache_figuras, cache_series
+from binomio.inicializacao import pre_aquecer
+from binomio.metricas import metricas
+from binomio.pascal import triangulo_compartilhado
+from binomio.trabalhadores import TarefaCancelada, TempoEsgotado, pool_simbolico
+
+TERMOS_POR_PAGINA = 20
+
+# Endereço do pacote HTML estático (python -m binomio.estatico), quando publicado.
+URL_ESTATICO = os.environ.get("BINOMIO_URL_ESTATICO")
+
+MENSAGEM_LIMITE = "O cálculo excedeu o limite de tempo ou de memória do servidor. Tente termos ou expoentes menores."
+
+# Envia o trabalho simbólico ao pool de processos. Um pedido novo da mesma sessão e
+# página cancela o anterior; pedidos cancelados simplesmente encerram este rerun.
+def executar_simbolico(pagina, func, *args):
+    if "id_sessao" not in st.session_state:
+        st.session_state.id_sessao = uuid.uuid4().hex
+    try:
+        with metricas.medir("pool"):
+            return pool_simbolico.executar(func, *args, chave=(st.session_state.id_sessao, pagina))
+    except TarefaCancelada:
+        st.stop()
+
+# Verificação por avaliação em pontos aleatórios, executada no pool de processos.
+def comparar_no_pool(pagina):
+    from binomio.verificacao import comparar_por_avaliacao
+
+    return lambda esperado, texto: executar_simbolico(pagina, comparar_por_avaliacao, esperado, texto)
+
+# Cada sessão guarda apenas o índice do exercício atual no pool pré-calculado; o
+# exercício permanece o mesmo entre reruns até o aluno pedir um novo.
+def exercicio_atual(tipo):
+    from binomio.exercicios import pool_exercicios
+
+    pool = pool_exercicios(tipo)
+    chave = f"exercicio_{tipo}"
+    if chave not in st.session_state:
+        st.session_state[chave] = random.randrange(len(pool))
+    return pool[st.session_state[chave]]
+
+def novo_exercicio(tipo):
+    from binomio.exercicios import pool_exercicios
+
+    pool = pool_exercicios(tipo)
+    chave = f"exercicio_{tipo}"
+    st.session_state[chave] = (st.session_state.get(chave, 0) + random.randrange(1, len(pool))) % len(pool)
+    st.session_state.pop(f"dica_{tipo}", None)
 
 def main():
     st.set_page_config(page_title='Binômio de Newton', page_icon="📐", layout="centered")
@@ -12,7 +62,23 @@ def main():
     options = ["Teoria", "Calculadora", "Coeficientes", "Triângulo de Pascal", "Laboratório",
                "Passo a Passo", "Identificação de Binômios", "Exercícios"]
     choice = st.sidebar.radio("Escolha uma opção", options)
+    if URL_ESTATICO:
+        st.sidebar.markdown(f"[Versão estática de Teoria, Passo a Passo e Exercícios]({URL_ESTATICO})")
+
+    metricas.iniciar_rerun(choice)
+    with metricas.medir("pagina"):
+        mostrar_pagina(choice)
+    st.write("Autores: João Renan S. Lopes E Pedro Girotto")
+    st.write("Centro Universitário do Pará")
+
+    if st.sidebar.checkbox("Mostrar tempos (depuração)"):
+        painel_tempos()
+    metricas.exportar_periodicamente()
 
+    pre_aquecer()
+    pool_simbolico.aquecer()
+
+def mostrar_pagina(choice):
     if choice == "Teoria":
         teoria()
     elif choice == "Calculadora":
@@ -29,211 +95,336 @@ def main():
         passo_a_passo()
     elif choice == "Identificação de Binômios":
         identificacao_binomios()
-    st.write("Autores: João Renan S. Lopes E Pedro Girotto")
-    st.write("Centro Universitário do Pará")
-
-def teoria():
-    st.header("Teoria do Binômio de Newton")
-    st.subheader("O Básico e aplicações")
-
-    st.write(r"""
-    O Binômio de Newton é uma expressão algébrica que permite expandir potências de binômios de forma eficiente. 
-    A fórmula geral para $(x + y)^n$ é:
-    """)
 
-    st.latex(r"(x + y)^n = \sum_{k=0}^n \binom{n}{k} x^{n-k} y^k")
+# Tempos do rerun atual por fase e, abaixo, os percentis acumulados por página e fase
+# desde o início do servidor (os mesmos exportados em BINOMIO_METRICAS).
+def painel_tempos():
+    st.sidebar.subheader("Tempos deste rerun")
+    st.sidebar.table([{"página": pagina, "fase": fase, "ms": round(segundos * 1000, 2)}
+                      for pagina, fase, segundos in metricas.medicoes_rerun()])
+    with st.sidebar.expander("Percentis acumulados (ms)"):
+        st.table([{"página": linha["pagina"], "fase": linha["fase"], "n": linha["contagem"],
+                   **{q: round(linha[q] * 1000, 2) for q in ("p50", "p95", "p99")}}
+                  for linha in metricas.resumo()])
+
+# Gráfico de linhas interativo com a especificação Vega-Lite montada à mão: st.line_chart
+# monta e valida uma especificação do Altair a cada rerun, o que custava mais que a série.
+# O intervalo ligado às escalas dá o arrastar e o zoom; o tooltip, os valores sob o cursor.
+def grafico_linhas(dados, x):
+    colunas = [c for c in dados if c != x]
+    eixo_x = {"field": x, "type": "quantitative"}
+    spec = {"params": [{"name": "grade", "select": "interval", "bind": "scales"}], "mark": "line",
+            "encoding": {"x": eixo_x, "y": {"field": colunas[0], "type": "quantitative"},
+                         "tooltip": [eixo_x, {"field": colunas[0], "type": "quantitative"}]}}
+    if len(colunas) > 1:
+        serie = {"field": "série", "type": "nominal", "title": None}
+        valor = {"field": "valor", "type": "quantitative", "title": None}
+        spec["transform"] = [{"fold": colunas, "as": ["série", "valor"]}]
+        spec["encoding"].update(y=valor, color=serie, tooltip=[eixo_x, serie, valor])
+    st.vega_lite_chart(dados, spec, use_container_width=True)
+
+
+# Renderiza os blocos de binomio.conteudo, o mesmo conteúdo exportado como HTML estático.
+def mostrar_blocos(blocos):
+    for bloco in blocos:
+        tipo = bloco[0]
+        if tipo == "cabecalho":
+            st.header(bloco[1])
+        elif tipo == "subtitulo":
+            st.subheader(bloco[1])
+        elif tipo == "texto":
+            st.write(bloco[1])
+        elif tipo == "formula":
+            st.latex(bloco[1])
+        elif tipo == "solucao":
+            if st.button(bloco[1]):
+                mostrar_blocos([bloco[2]])
+        elif tipo == "exercicio":
+            numero, pergunta, solucao = bloco[1:]
+            with st.expander(f"Exercício {numero}"):
+                st.write(pergunta)
+                if st.button(f"Mostrar solução {numero}"):
+                    st.write(solucao)
+        elif tipo == "info":
+            st.info(bloco[1])
+        elif tipo == "sucesso":
+            st.success(bloco[1])
 
-    st.write(r"""
-    Onde:
-    - $n$ é o expoente do binômio
-    - $k$ é o índice da soma, variando de 0 a n
-    - $\binom{n}{k}$ é o coeficiente binomial, também conhecido como "n escolhe k"
-
-    O coeficiente binomial $\binom{n}{k}$ representa o número de maneiras de escolher $k$ itens de um conjunto de $n$ itens, e é calculado como:
-    """)
-
-    st.latex(r"\binom{n}{k} = \frac{n!}{k!(n-k)!}")
-
-    st.write("""
-    Aplicações do Binômio de Newton incluem:
-    1. Expansão de expressões algébricas
-    2. Cálculo de probabilidades em distribuições binomiais
-    3. Aproximações em física e engenharia
-    4. Teoria dos números e criptografia
-    """)
+def teoria():
+    from binomio.conteudo import TEORIA
 
-    st.subheader("Exemplo 1: Expansão de $(x + 1)^3$")
-    if st.button("Mostrar solução exemplo 1"):
-        st.latex(r"(x + 1)^3 = x^3 + 3x^2 + 3x + 1")
+    mostrar_blocos(TEORIA)
 
-    st.subheader("Exemplo 2: Expansão de $(2x + y)^4$")
-    if st.button("Mostrar solução exemplo 2"):
-        st.latex(r"(2x + y)^4 = 16x^4 + 32x^3y + 24x^2y^2 + 8xy^3 + y^4")
+def calculadora():
+    import sympy as sp
 
-    st.info("Dica: O Binômio de Newton é uma ferramenta poderosa para simplificar cálculos complexos em várias áreas da matemática e ciências aplicadas.")
+    from binomio.nucleo import expansao, latex_soma
 
-def calculadora():
     st.header("Calculadora do Binômio de Newton")
     st.subheader("Expanda binômios interativamente")
 
+    if st.radio("Tipo de expansão", ["Binômio", "Multinômio"], horizontal=True) == "Multinômio":
+        calculadora_multinomio()
+        return
+
     col1, col2 = st.columns(2)
 
     with col1:
         x = st.text_input("Primeiro termo (ex: x, 2*x, -y)", "x")
         y = st.text_input("Segundo termo (ex: y, 3, 2*z)", "y")
-        n = st.slider("Expoente", 0, 10, 2)
+        n = st.slider("Expoente", 0, 200, 2)
+        pagina = st.number_input("Página de termos", min_value=1, value=1)
 
     with col2:
-        st.write("Expansão:")
+        # Apenas a página atual de termos é gerada e enviada ao navegador; o LaTeX da
+        # expansão completa só é montado quando pedido. O total de termos vem do cálculo:
+        # termos com símbolos em comum (ex: x + 1 e x) geram menos ou mais que n + 1.
+        total = n + 1
         try:
-            expansion = sp.expand((sp.sympify(x) + sp.sympify(y)) ** n)
-            st.latex(sp.latex(expansion))
-
-            st.write("Termos individuais:")
-            terms = expansion.as_ordered_terms()
-            for i, term in enumerate(terms):
-                st.latex(f"Termo {i + 1}: {sp.latex(term)}")
+            resultado = executar_simbolico("calculadora", expansao, x, y, n,
+                                           (pagina - 1) * TERMOS_POR_PAGINA, TERMOS_POR_PAGINA)
+            total = resultado["total"]
+            paginas = -(-total // TERMOS_POR_PAGINA)
+            if total <= TERMOS_POR_PAGINA and resultado["termos"]:
+                st.write("Expansão:")
+                st.latex(latex_soma(resultado["termos"]))
+            elif total > TERMOS_POR_PAGINA and st.button("Gerar LaTeX da expansão completa"):
+                st.code(executar_simbolico("calculadora", expansao, x, y, n)["latex"], language="latex")
+
+            st.write(f"Termos individuais ({total} no total, {paginas} páginas):")
+            if not resultado["termos"]:
+                st.warning(f"A página {pagina} não existe; escolha uma página entre 1 e {paginas}.")
+            for i, term in enumerate(resultado["termos"], start=resultado["inicio"] + 1):
+                st.latex(f"Termo {i}: {term}")
         except sp.SympifyError:
             st.error("Erro: Um ou mais termos não puderam ser interpretados. Verifique as entradas e tente novamente.")
+        except (TempoEsgotado, MemoryError):
+            st.error(MENSAGEM_LIMITE)
 
     st.subheader("Insight")
-    st.write(f"A expansão de ({x} + {y})^{n} terá {n + 1} termos.")
+    st.write(f"A expansão de ({x} + {y})^{n} terá {total} termos.")
+
+def calculadora_multinomio():
+    import sympy as sp
+
+    from binomio.nucleo import multinomio
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        termos = st.text_input("Termos separados por vírgula (ex: x, 2*y, -z)", "x, y, z")
+        n = st.slider("Expoente", 0, 50, 3)
+        pagina = st.number_input("Página de termos", min_value=1, value=1)
+
+    with col2:
+        try:
+            resultado = executar_simbolico("calculadora", multinomio, termos, n,
+                                           (pagina - 1) * TERMOS_POR_PAGINA, TERMOS_POR_PAGINA)
+        except sp.SympifyError:
+            st.error("Erro: Um ou mais termos não puderam ser interpretados. Verifique as entradas e tente novamente.")
+            return
+        except (TempoEsgotado, MemoryError):
+            st.error(MENSAGEM_LIMITE)
+            return
+
+        total = resultado["total"]
+        paginas = -(-total // TERMOS_POR_PAGINA)
+        st.write(f"A expansão tem {total} termos ({paginas} páginas).")
+        if not resultado["termos"]:
+            st.warning(f"A página {pagina} não existe; escolha uma página entre 1 e {paginas}.")
+        for i, term in enumerate(resultado["termos"], start=resultado["inicio"] + 1):
+            st.latex(f"Termo {i}: {term}")
 
 def coeficientes():
+    import sympy as sp
+
+    from binomio.figuras import figura_png, gerenciador_figuras
+
     st.header("Coeficientes Binomiais")
     st.subheader("Explore os coeficientes do Binômio de Newton")
 
+    modo = st.radio("Modo", ["Tabela", "Termo geral", "Grande n"], horizontal=True)
+    if modo == "Termo geral":
+        termo_geral()
+        return
+    if modo == "Grande n":
+        coeficientes_grandes()
+        return
+
     col1, col2 = st.columns(2)
 
     with col1:
         n = st.number_input("n", 0, 20, 5)
         k = st.number_input("k", 0, n, 2)
 
-        coef = sp.binomial(n, k)
+        linha = triangulo_compartilhado.linha(n)
+        coef = linha[k]
         st.write(f"O coeficiente binomial $\\binom{{{n}}}{{{k}}}$ é:")
         st.latex(sp.latex(coef))
 
     with col2:
         st.write("Visualização:")
-        fig, ax = plt.subplots()
-        x = range(n + 1)
-        y = [sp.binomial(n, i) for i in x]
-        ax.bar(x, y)
-        ax.set_title(f"Coeficientes Binomiais para n={n}")
-        ax.set_xlabel("k")
-        ax.set_ylabel("Coeficiente")
-        st.pyplot(fig)
 
-    st.info(f"Interpretação: Existem {coef} maneiras de escolher {k} itens de um conjunto de {n} itens.")
+        def renderizar():
+            with gerenciador_figuras.figura("coeficientes") as fig:
+                ax = fig.subplots()
+                ax.bar(range(n + 1), list(linha))
+                ax.set_title(f"Coeficientes Binomiais para n={n}")
+                ax.set_xlabel("k")
+                ax.set_ylabel("Coeficiente")
+                return figura_png(fig)
+
+        if st.toggle("Gráfico interativo", True, key="interativo_coeficientes"):
+            st.bar_chart({"k": list(range(n + 1)), "Coeficiente": list(linha)}, x="k", y="Coeficiente")
+        else:
+            st.image(cache_figuras.obter(("coeficientes", n), renderizar))
 
-def triangulo_pascal():
-    st.header("Triângulo de Pascal - Visualização Ampliada")
+    st.info(f"Interpretação: Existem {coef} maneiras de escolher {k} itens de um conjunto de {n} itens.")
 
-    rows = st.slider("Número de linhas", 1, 10, 7)
+def coeficientes_grandes():
+    from binomio.desenho import desenhar_coeficientes_grandes
+    from binomio.figuras import figura_png, gerenciador_figuras
 
-    triangle = [[1]]
-    for i in range(1, rows):
-        row = [1]
-        for j in range(1, i):
-            row.append(triangle[i - 1][j - 1] + triangle[i - 1][j])
-        row.append(1)
-        triangle.append(row)
+    n = st.number_input("n", 1, 10 ** 7, 10000)
+    col1, col2 = st.columns(2)
+    with col1:
+        escala_log = st.checkbox("Escala logarítmica", True)
+    with col2:
+        normal = st.checkbox("Sobrepor aproximação normal")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
-    ax.set_axis_off()
+    def renderizar():
+        with gerenciador_figuras.figura("coeficientes") as fig:
+            desenhar_coeficientes_grandes(fig.subplots(), n, escala_log, normal)
+            return figura_png(fig)
 
-    for i, row in enumerate(triangle):
-        for j, num in enumerate(row):
-            ax.text(j - i / 2, -i, str(num), ha='center', va='center', fontweight='bold', fontsize=14)
+    chave = ("coeficientes_grandes", n, escala_log, normal)
+    if st.toggle("Gráfico interativo", True, key="interativo_coeficientes_grandes"):
+        def calcular():
+            import numpy as np
 
-            if i > 0:
-                if j < len(row) - 1:
-                    ax.plot([j - i / 2, j - i / 2 - 0.5], [-i, -(i - 1)], color='black', lw=1)
-                if j > 0:
-                    ax.plot([j - i / 2, j - i / 2 + 0.5], [-i, -(i - 1)], color='black', lw=1)
+            from binomio.avaliacao import intercalar_min_max, serie_coeficientes_grandes
 
-    plt.title("Triângulo de Pascal", fontsize=18)
-    st.pyplot(fig)
+            x, minimos, maximos, aproximacao = serie_coeficientes_grandes(n, escala_log, normal)
+            k, y = intercalar_min_max(x, minimos, maximos)
+            dados = {"k": k, "log10 C(n, k)" if escala_log else "C(n, k) / C(n, n/2)": y}
+            if aproximacao is not None:
+                # Um valor da aproximação para cada ponto de k (dois por faixa após a redução).
+                dados["Aproximação normal"] = np.repeat(aproximacao, len(k) // len(x))
+            return dados
 
-    st.subheader("Fatos Curiosos")
-    st.write("1. As somas das linhas são potências de 2: 1, 2, 4, 8, 16, 32, ...")
-    st.write("2. Os números nas diagonais formam os números de Fibonacci.")
-    st.write("3. O triângulo contém padrões fractais como o Triângulo de Sierpinski.")
-
-def exercicios_criativos():
-    st.header("Exercícios Criativos")
-    st.subheader("Hora da verdade!")
-
-    exercises = [
-        {
-            "question": "Um jardim tem formato de triângulo equilátero. Se a cada ano o jardineiro aumenta o comprimento de cada lado em 1 metro, quantos metros quadrados o jardim terá aumentado após 3 anos?",
-            "solution": r"""
-            Seja $s$ o comprimento inicial do lado do jardim.
-            A área de um triângulo equilátero é dada por $A = \frac{\sqrt{3}}{4}s^2$.
+        grafico_linhas(cache_series.obter(chave, calcular), "k")
+    else:
+        st.image(cache_figuras.obter(chave, renderizar))
+    st.caption("Para n grande os coeficientes são agrupados por faixas de k, mantendo o mínimo e o máximo de cada faixa.")
 
-            Após 3 anos, o lado será $s+3$.
-            O aumento na área será:
+def termo_geral():
+    from binomio.termo_geral import magnitude_termo, resumo_termo_exato, termo_mod
 
-            $\Delta A = \frac{\sqrt{3}}{4}((s+3)^2 - s^2)$
+    st.write(r"Calcula o termo $\binom{n}{k} (ax)^{n-k} b^k$ de $(ax + b)^n$ sem expandir o binômio.")
 
-            $\Delta A = \frac{\sqrt{3}}{4}(s^2 + 6s + 9 - s^2)$
+    col1, col2 = st.columns(2)
+    with col1:
+        a = st.number_input("a (coeficiente de x)", -1000, 1000, 1)
+        b = st.number_input("b (termo constante)", -1000, 1000, 1)
+    with col2:
+        n_texto = st.text_input("n", "1000")
+        k_texto = st.text_input("k", "500")
 
-            $\Delta A = \frac{\sqrt{3}}{4}(6s + 9)$
+    resultado = st.radio("Resultado", ["Exato", "Módulo p", "Magnitude (log)"], horizontal=True)
 
-            $\Delta A = \frac{3\sqrt{3}}{2}s + \frac{9\sqrt{3}}{4}$
+    try:
+        n, k = int(n_texto), int(k_texto)
+    except ValueError:
+        st.error("n e k devem ser números inteiros.")
+        return
+    if n < 0 or not 0 <= k <= n:
+        st.error("É necessário que 0 ≤ k ≤ n.")
+        return
 
-            Este é o aumento em metros quadrados após 3 anos.
-            """
-        },
-        {
-            "question": "Um vírus se multiplica a cada hora, dobrando sua população. Se inicialmente havia 100 vírus, quantos haverá após 8 horas?",
-            "solution": r"""
-            Este é um problema de crescimento exponencial que pode ser resolvido usando o Binômio de Newton.
+    st.latex(rf"\binom{{{n}}}{{{k}}} \cdot {a}^{{{n - k}}} \cdot {b}^{{{k}}} \; x^{{{n - k}}}")
 
-            A população após n horas será: $100 \cdot 2^n$
+    if resultado == "Exato":
+        try:
+            resumo = executar_simbolico("termo_geral", resumo_termo_exato, a, b, n, k)
+        except ValueError as erro:
+            st.error(str(erro))
+        except (TempoEsgotado, MemoryError):
+            st.error(MENSAGEM_LIMITE)
+        else:
+            st.write(f"Coeficiente ({resumo['digitos']} dígitos):")
+            st.code(resumo["valor"], language=None)
+    elif resultado == "Módulo p":
+        p = st.number_input("p (primo)", 2, 1000000, 999983)
+        # Cada dígito de Lucas custa até p/2 multiplicações: com p perto de 10^6 e n perto
+        # de 10^18 são décimos de segundo, por isso o cálculo vai para o pool.
+        try:
+            resto = executar_simbolico("termo_geral", termo_mod, a, b, n, k, p)
+        except ValueError as erro:
+            st.error(str(erro))
+        except (TempoEsgotado, MemoryError):
+            st.error(MENSAGEM_LIMITE)
+        else:
+            st.latex(rf"\equiv {resto} \pmod{{{p}}}")
+    else:
+        try:
+            magnitude = magnitude_termo(a, b, n, k)
+        except ValueError as erro:
+            st.error(str(erro))
+            return
+        if magnitude is None:
+            st.latex("= 0")
+        else:
+            sinal, log10 = magnitude
+            if log10 < 1e9:
+                expoente = int(log10 // 1)
+                mantissa = 10 ** (log10 - expoente)
+                st.latex(rf"\approx {'-' if sinal < 0 else ''}{mantissa:.6f} \times 10^{{{expoente}}}")
+                st.caption(f"log10 |coeficiente| ≈ {log10:.6f}")
+            else:
+                # A parte fracionária de log10 já se perdeu no float: só a ordem de grandeza é confiável.
+                st.latex(rf"\approx {'-' if sinal < 0 else ''}10^{{{log10:.9e}}}")
+                st.caption(f"log10 |coeficiente| ≈ {log10:.9e}")
 
-            Para n = 8:
+def triangulo_pascal():
+    from binomio.desenho import LIMITE_ROTULOS, desenhar_triangulo
+    from binomio.figuras import figura_png, gerenciador_figuras
 
-            $100 \cdot 2^8 = 100 \cdot 256 = 25.600$
+    st.header("Triângulo de Pascal - Visualização Ampliada")
 
-            Portanto, após 8 horas, haverá 25.600 vírus.
-            """
-        },
-        {
-            "question": "Em um jogo de dados, qual é a probabilidade de obter exatamente 3 números pares em 5 lançamentos?",
-            "solution": r"""
-            Este é um problema de probabilidade binomial.
+    modo = st.radio("Modo de visualização", ["Números", "Cores (mod p)"], horizontal=True)
+    rows = st.slider("Número de linhas", 1, 1024 if modo == "Cores (mod p)" else 64, 7)
+    modulo = st.selectbox("p", [2, 3, 5, 7]) if modo == "Cores (mod p)" else None
 
-            A probabilidade de obter um número par em um lançamento é 3/6 = 1/2.
+    triangle = triangulo_compartilhado.linhas(rows) if rows <= LIMITE_ROTULOS else None
+    if modo == "Números" and rows > LIMITE_ROTULOS:
+        st.caption(f"Com mais de {LIMITE_ROTULOS} linhas os números são omitidos para manter o desenho legível.")
 
-            Usamos o Binômio de Newton com n = 5 (total de lançamentos) e k = 3 (número de sucessos desejados).
+    def renderizar():
+        with gerenciador_figuras.figura("triangulo_pascal", figsize=(10, 8)) as fig:
+            ax = fig.subplots()
+            desenhar_triangulo(ax, rows, triangle, modulo)
+            ax.set_title("Triângulo de Pascal", fontsize=18)
+            return figura_png(fig)
 
-            $P(X = 3) = \binom{5}{3} (1/2)^3 (1/2)^2$
+    st.image(cache_figuras.obter(("triangulo_pascal", rows, modulo), renderizar))
 
-            $= 10 \cdot (1/8) \cdot (1/4) = 10/32 = 5/16$
+    st.subheader("Fatos Curiosos")
+    st.write("1. As somas das linhas são potências de 2: 1, 2, 4, 8, 16, 32, ...")
+    st.write("2. Os números nas diagonais formam os números de Fibonacci.")
+    st.write("3. O triângulo contém padrões fractais como o Triângulo de Sierpinski (experimente o modo Cores com p = 2).")
 
-            A probabilidade é 5/16 ou aproximadamente 0,3125 ou 31,25%.
-            """
-        },
-        {
-            "question": "Qual a expansão de $(3x + 2)^5$?",
-            "solution": r"""
-            A expansão de $(3x + 2)^5$ é:
+def exercicios_criativos():
+    from binomio.conteudo import EXERCICIOS
 
-            $ = 243x^5 + 810x^4 + 1080x^3 + 720x^2 + 240x + 32$
-            """
-        }
-    ]
+    mostrar_blocos(EXERCICIOS)
 
-    for i, exercise in enumerate(exercises):
-        with st.expander(f"Exercício {i + 1}"):
-            st.write(exercise["question"])
-            if st.button(f"Mostrar solução {i + 1}"):
-                st.write(exercise["solution"])
+def laboratorio_virtual():
+    import numpy as np
 
-    st.success("Parabéns por enfrentar esses desafios! Lembre-se, a prática leva à perfeição em matemática. Abraços do monitor!")
+    from binomio.avaliacao import amostrar_para_grafico, latex_polinomio
+    from binomio.figuras import figura_png, gerenciador_figuras
+    from binomio.polinomio import avaliar_produto, produto_binomios
 
-def laboratorio_virtual():
     st.header("Laboratório Virtual")
     st.subheader("Experimente com o Binômio de Newton")
 
@@ -247,26 +438,60 @@ def laboratorio_virtual():
     with col1:
         a = st.number_input("Coeficiente de x", -10.0, 10.0, 1.0, 0.1)
         b = st.number_input("Termo constante", -10.0, 10.0, 1.0, 0.1)
-        n = st.slider("Expoente", 1, 10, 2)
-
-    x = sp.Symbol('x')
-    expansion = sp.expand((a * x + b) ** n)
+        n = st.slider("Expoente", 1, 100, 2)
+        fatores = [(a, b, n)]
+        titulo = f"({a}x + {b})^{n}"
+        if st.checkbox("Multiplicar por (cx + d)^m"):
+            c = st.number_input("Coeficiente c", -10.0, 10.0, 1.0, 0.1)
+            d = st.number_input("Termo constante d", -10.0, 10.0, -1.0, 0.1)
+            m = st.slider("Expoente m", 1, 100, 1)
+            fatores.append((c, d, m))
+            titulo += f" · ({c}x + {d})^{m}"
+        x_min, x_max = st.slider("Domínio do gráfico", -10.0, 10.0, (-2.0, 2.0), 0.1)
+        pontos = st.select_slider("Pontos amostrados", [100, 1000, 10000, 100000], 1000)
+
+    # Coeficientes exatos (frações) para a expansão exibida; o gráfico é avaliado em float.
+    with metricas.medir("calculo"):
+        coefs = produto_binomios(fatores)
+    with metricas.medir("latex"):
+        latex = latex_polinomio(coefs)
+    grau = len(coefs) - 1
 
     with col2:
         st.write("Expansão:")
-        st.latex(sp.latex(expansion))
+        if grau <= 20:
+            st.latex(latex)
+        else:
+            with st.expander(f"Expansão exata (grau {grau})"):
+                st.latex(latex)
 
         st.write("Gráfico da função:")
-        x_vals = np.linspace(-2, 2, 100)
-        y_vals = [expansion.subs(x, val) for val in x_vals]
+        interativo = st.toggle("Gráfico interativo", True, key="interativo_laboratorio")
+        chave = ("laboratorio", tuple(fatores), x_min, x_max, pontos)
+
+        if interativo:
+            def calcular():
+                x_vals = np.linspace(x_min, x_max, pontos)
+                x_grafico, y_grafico = amostrar_para_grafico(x_vals, avaliar_produto(fatores, x_vals))
+                return {"x": x_grafico, "y": y_grafico}
+
+            grafico_linhas(cache_series.obter(chave, calcular), "x")
+
+        def renderizar():
+            x_vals = np.linspace(x_min, x_max, pontos)
+            y_vals = avaliar_produto(fatores, x_vals)
 
-        fig, ax = plt.subplots()
-        ax.plot(x_vals, y_vals)
-        ax.set_title(f"Gráfico de ({a}x + {b})^{n}")
-        ax.set_xlabel("x")
-        ax.set_ylabel("y")
-        ax.grid(True)
-        st.pyplot(fig)
+            with gerenciador_figuras.figura("laboratorio") as fig:
+                ax = fig.subplots()
+                ax.plot(x_vals, y_vals)
+                ax.set_title(f"Gráfico de {titulo}")
+                ax.set_xlabel("x")
+                ax.set_ylabel("y")
+                ax.grid(True)
+                return figura_png(fig)
+
+        if not interativo:
+            st.image(cache_figuras.obter(chave, renderizar))
 
     st.subheader("Desafio do Laboratório")
     st.write("Tente ajustar os parâmetros para criar uma função que:")
@@ -279,53 +504,13 @@ def laboratorio_virtual():
     st.info(challenge)
 
 def passo_a_passo():
-    st.header("Passo a Passo")
-    st.subheader("Como expandir e simplificar um binômio")
-
-    st.write(r"""
-    Antes de iniciar a parte interativa, é importante entender detalhadamente como expandir um binômio passo a passo.
-
-    ### Entendendo o Binômio de Newton
-
-    O Binômio de Newton é uma fórmula que permite expandir potências de binômios. A fórmula geral é:
-
-    $$(x + y)^n = \sum_{k=0}^n \binom{n}{k} x^{n-k} y^k$$
-
-    Onde:
-    - $n$ é o expoente do binômio
-    - $k$ é o índice da soma, variando de 0 a n
-    - $\binom{n}{k}$ é o coeficiente binomial, também conhecido como "n escolhe k"
-
-    ### Passo a Passo para Expandir um Binômio
+    import sympy as sp
 
-    Utiliza-se o exemplo $(a + b)^3$ para ilustrar o processo:
+    from binomio.conteudo import EXPLICACAO_PASSO_A_PASSO
+    from binomio.nucleo import passos
+    from binomio.verificacao import RespostaMuitoGrande, verificar_resposta
 
-    1. Identificação dos valores de $n$, $x$, e $y$:
-       - $n = 3$
-       - $x = a$
-       - $y = b$
-
-    2. Aplicação da fórmula para cada valor de $k$ de 0 a $n$:
-
-       - Para $k = 0$: $\binom{3}{0} a^3 b^0 = 1 \cdot a^3 \cdot 1 = a^3$
-       - Para $k = 1$: $\binom{3}{1} a^2 b^1 = 3 \cdot a^2 \cdot b = 3a^2b$
-       - Para $k = 2$: $\binom{3}{2} a^1 b^2 = 3 \cdot a \cdot b^2 = 3ab^2$
-       - Para $k = 3$: $\binom{3}{3} a^0 b^3 = 1 \cdot 1 \cdot b^3 = b^3$
-
-    3. Soma de todos os termos:
-
-       $(a + b)^3 = a^3 + 3a^2b + 3ab^2 + b^3$
-
-    Este é o resultado final da expansão.
-
-    ### Pontos Importantes a Serem Lembrados
-
-    - O número de termos na expansão será sempre $n + 1$.
-    - Os expoentes de $x$ diminuem de $n$ até 0, enquanto os de $y$ aumentam de 0 até $n$.
-    - Os coeficientes binomiais $\binom{n}{k}$ formam o Triângulo de Pascal.
-
-    Após compreender o processo, pode-se praticar com alguns exemplos interativos.
-    """)
+    mostrar_blocos(EXPLICACAO_PASSO_A_PASSO)
 
     col1, col2 = st.columns(2)
 
@@ -339,20 +524,19 @@ def passo_a_passo():
 
     if st.button("Expandir passo a passo"):
         try:
-            x_sym, y_sym = sp.symbols('x y')
-            expr = (sp.sympify(x) + sp.sympify(y)) ** n
-            expansion = sp.expand(expr)
+            resultado = executar_simbolico("passo_a_passo", passos, x, y, n)
 
             st.write("### Passos da expansão:")
-            for k in range(n + 1):
-                term = sp.binomial(n, k) * sp.sympify(x) ** (n - k) * sp.sympify(y) ** k
-                st.latex(rf"\binom{{{n}}}{{{k}}} \cdot ({x})^{{{n - k}}} \cdot ({y})^{{{k}}} = {sp.latex(term)}")
+            for k, term in enumerate(resultado["passos"]):
+                st.latex(rf"\binom{{{n}}}{{{k}}} \cdot ({x})^{{{n - k}}} \cdot ({y})^{{{k}}} = {term}")
 
             st.write("### Resultado final:")
-            st.latex(sp.latex(expansion))
+            st.latex(resultado["latex"])
         except sp.SympifyError:
             st.error(
                 "Erro ao processar a expressão. É necessário usar '*' para multiplicação (ex: 2*x em vez de 2x).")
+        except (TempoEsgotado, MemoryError):
+            st.error(MENSAGEM_LIMITE)
 
     st.info("Experimente com diferentes termos e expoentes para observar como a expansão se modifica.")
 
@@ -362,34 +546,36 @@ def passo_a_passo():
     exercise_type = st.radio("Escolha o tipo de exercício:", ["Expansão", "Coeficiente Específico"])
 
     if exercise_type == "Expansão":
-        a, b = random.randint(1, 5), random.randint(1, 5)
-        n = random.randint(2, 4)
-        expr = sp.expand((a * sp.Symbol('x') + b) ** n)
+        exercicio = exercicio_atual("expansao")
         st.write('Expanda')
-        st.latex(rf"({a}x + {b})^{{{n}}}")
+        st.latex(exercicio["latex_binomio"])
+        st.button("Novo exercício", on_click=novo_exercicio, args=("expansao",))
         user_answer = st.text_input("Resposta:")
 
         if st.button("Verificar"):
             try:
-                if sp.expand(sp.sympify(user_answer)) == expr:
+                if verificar_resposta(exercicio["coeficientes"], user_answer, avaliar=comparar_no_pool("passo_a_passo")):
                     st.success("Correto! A resposta está precisa.")
                 else:
                     st.error("Incorreto. É recomendável tentar novamente.")
+            except RespostaMuitoGrande as erro:
+                st.error(f"Resposta rejeitada: {erro}")
+            except (TempoEsgotado, MemoryError):
+                st.error(MENSAGEM_LIMITE)
             except:
                 st.error("Erro ao processar a resposta. Verifique a sintaxe.")
 
         if st.button("Mostrar solução"):
             st.write("A expansão é:")
-            st.latex(sp.latex(expr))
+            st.latex(exercicio["latex_expansao"])
 
     elif exercise_type == "Coeficiente Específico":
-        a, b = random.randint(1, 5), random.randint(1, 5)
-        n = random.randint(4, 6)
-        k = random.randint(1, n - 1)
-        coef = sp.binomial(n, k) * a ** (n - k) * b ** k
+        exercicio = exercicio_atual("coeficiente")
+        a, b, n, k, coef = (exercicio[campo] for campo in ("a", "b", "n", "k", "coeficiente"))
 
         st.write('Qual é o coeficiente de')
         st.latex(rf"x^{{{n - k}}} \text{{ na expansão de }} ({a}x + {b})^{{{n}}}")
+        st.button("Novo exercício", on_click=novo_exercicio, args=("coeficiente",))
         user_answer = st.number_input("Resposta:", step=1)
 
         if st.button("Verificar"):
@@ -402,7 +588,34 @@ def passo_a_passo():
             st.write("O coeficiente é:")
             st.latex(rf"\binom{{{n}}}{{{k}}} \cdot {a}^{{{n - k}}} \cdot {b}^{{{k}}} = {coef}")
 
+# Dica progressiva a partir do binômio recuperado dos coeficientes: o expoente, depois a.
+def mostrar_dica(tipo, coefs):
+    from binomio.identificacao import identificar
+
+    resultado = identificar(coefs) if coefs else None
+    if resultado is None:
+        st.info("Dica: compare o maior expoente com o número de termos e procure o padrão do Triângulo de Pascal.")
+        return
+    a, b, n = resultado
+    nivel = st.session_state.get(f"dica_{tipo}", 0)
+    if nivel >= 1:
+        st.info(f"Dica: o maior expoente é {n}, então o binômio está elevado a {n}.")
+    if nivel >= 2:
+        st.info(rf"Dica: o coeficiente de $x^{{{n}}}$ é ${coefs[0]} = ({a})^{{{n}}}$, então $a = {a}$.")
+    if nivel >= 3:
+        st.info(rf"Dica: o termo constante é {coefs[-1]}; pela raiz n-ésima e pelo sinal do coeficiente de $x^{{{n - 1}}}$, conclui-se $b = {b}$.")
+
+
+def pedir_dica(tipo):
+    chave = f"dica_{tipo}"
+    st.session_state[chave] = min(st.session_state.get(chave, 0) + 1, 3)
+
+
 def identificacao_binomios():
+    import sympy as sp
+
+    from binomio.verificacao import RespostaMuitoGrande, verificar_resposta
+
     st.header("Identificação de Binômios")
     st.subheader("Como identificar binômios de expressões expandidas")
 
@@ -453,26 +666,12 @@ def identificacao_binomios():
     Após compreender o processo de identificação, pode-se praticar com alguns exemplos interativos.
     """)
 
-    # Lista de binômios pré-definidos
-    binomios = [
-        ("x + 1", 2),
-        ("x - 2", 3),
-        ("2*x + 3", 2),
-        ("3*x - 1", 3),
-        ("x + y", 2)
-    ]
-
-    # Escolha aleatória de um binômio
-    x, y = sp.symbols('x y')
-    binomio, expoente = random.choice(binomios)
-    try:
-        expr = sp.expand((sp.sympify(binomio)) ** expoente)
-    except sp.SympifyError:
-        st.error("Erro ao processar o binômio. É necessário recarregar a página.")
-        return
+    exercicio = exercicio_atual("identificacao")
+    binomio, expoente, expr = exercicio["binomio"], exercicio["expoente"], exercicio["expr"]
 
     st.subheader(f"Identifique o binômio original da expressão:")
-    st.latex(sp.latex(expr))
+    st.latex(exercicio["latex_expansao"])
+    st.button("Novo exercício", key="novo_identificacao", on_click=novo_exercicio, args=("identificacao",))
 
     col1, col2 = st.columns(2)
 
@@ -484,17 +683,25 @@ def identificacao_binomios():
     if st.button("Verificar"):
         if user_binomio and user_expoente:
             try:
-                user_expr = sp.expand((sp.sympify(user_binomio)) ** user_expoente)
-                if user_expr == expr:
+                if verificar_resposta(expr, f"({user_binomio})**{user_expoente}",
+                                      avaliar=comparar_no_pool("identificacao")):
                     st.success("Correto! O binômio original foi identificado corretamente.")
                 else:
                     st.error("Incorreto. É recomendável tentar novamente.")
                     st.write("Dica: Observe atentamente os coeficientes e os termos constantes.")
             except sp.SympifyError:
                 st.error("Erro ao processar a resposta. Verifique a sintaxe e use '*' para multiplicação.")
+            except RespostaMuitoGrande as erro:
+                st.error(f"Resposta rejeitada: {erro}")
+            except (TempoEsgotado, MemoryError):
+                st.error(MENSAGEM_LIMITE)
         else:
             st.warning("É necessário preencher o binômio e o expoente antes de verificar.")
 
+    st.button("Pedir dica", key="pedir_dica_identificacao", on_click=pedir_dica, args=("identificacao",))
+    if st.session_state.get("dica_identificacao"):
+        mostrar_dica("identificacao", exercicio["coeficientes"])
+
     if st.button("Revelar resposta"):
         st.write("O binômio original era:")
         st.latex(rf"({binomio})^{{{expoente}}}")
@@ -506,20 +713,12 @@ def identificacao_binomios():
 
     difficulty = st.radio("Escolha o nível de dificuldade:", ["Nivel 1", "Nivel 2", "Nivel 3"])
 
-    if difficulty == "Nivel 1":
-        a, b = random.randint(1, 5), random.randint(1, 5)
-        n = 2
-    elif difficulty == "Nivel 2":
-        a, b = random.randint(1, 10), random.randint(1, 10)
-        n = 3
-    else:
-        a, b = random.randint(1, 15), random.randint(1, 15)
-        n = 4
-
-    expr = sp.expand((a * sp.Symbol('x') + b) ** n)
+    exercicio = exercicio_atual(difficulty)
+    a, b, n = exercicio["a"], exercicio["b"], exercicio["n"]
 
     st.write("Identifique o binômio e o expoente para a seguinte expressão expandida:")
-    st.latex(sp.latex(expr))
+    st.latex(exercicio["latex_expansao"])
+    st.button("Novo exercício", key="novo_nivel", on_click=novo_exercicio, args=(difficulty,))
 
     col1, col2 = st.columns(2)
     with col1:
@@ -534,9 +733,13 @@ def identificacao_binomios():
         else:
             st.error("Incorreto. Recomenda-se analisar a expressão mais cuidadosamente.")
 
+    st.button("Pedir dica", key="pedir_dica_nivel", on_click=pedir_dica, args=(difficulty,))
+    if st.session_state.get(f"dica_{difficulty}"):
+        mostrar_dica(difficulty, exercicio["coeficientes"])
+
     if st.button("Mostrar binômio original"):
         st.write("O binômio original é:")
-        st.latex(rf"({a}x + {b})^{{{n}}}")
+        st.latex(exercicio["latex_binomio"])
 
 if __name__ == "__main__":
     main()
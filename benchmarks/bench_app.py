@@ -0,0 +1,286 @@
+# Benchmark e teste de carga do app inteiro, dirigido sem navegador pelo AppTest do
+# Streamlit. Cada cenário abre uma página da barra lateral com valores representativos
+# (expoente máximo na Calculadora, número máximo de linhas no Triângulo de Pascal etc.)
+# e mede a latência do rerun: o primeiro (frio) e a mediana dos seguintes (quente, com
+# caches já preenchidos), além do pico de memória alocada pelo Python durante um rerun
+# com os caches de figuras e de séries vazios (a figura ou a série é calculada de novo).
+# O trabalho feito nos processos do pool simbólico entra na latência, mas não na memória.
+#
+#   python benchmarks/bench_app.py [--reruns 5] [--cenario calculadora_binomio ...]
+#   python benchmarks/bench_app.py --sessoes 8 [--reruns 5]    # N sessões em paralelo (processos)
+#   python benchmarks/bench_app.py --salvar-baseline           # grava baseline_app.json
+#
+# Sem --salvar-baseline, os números são comparados com benchmarks/baseline_app.json e
+# o script termina com código 1 se algum ficar acima da tolerância. Um rerun que termina
+# em exceção ou no aviso de limite do pool simbólico (tempo ou memória) conta como falha
+# do cenário: o script termina com código 1 e o baseline não é gravado.
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from app import MENSAGEM_LIMITE
+from binomio.cache_figuras import cache_figuras, cache_series
+from binomio.inicializacao import pre_aquecer
+from binomio.trabalhadores import pool_simbolico
+
+APP = os.path.join(RAIZ, "app.py")
+BASELINE = os.path.join(RAIZ, "benchmarks", "baseline_app.json")
+TEMPO_LIMITE = 120
+
+
+def _widget(at, tipo, rotulo):
+    return next(w for w in getattr(at, tipo) if w.label == rotulo)
+
+
+def _pagina(nome):
+    return lambda at: at.sidebar.radio[0].set_value(nome)
+
+
+def _definir(tipo, rotulo, valor):
+    return lambda at: _widget(at, tipo, rotulo).set_value(valor)
+
+
+def _clicar(rotulo):
+    return lambda at: _widget(at, "button", rotulo).click()
+
+
+# Cada cenário é uma lista de passos; cada passo altera widgets e dispara um rerun.
+# A latência medida é a do último passo, repetido com os mesmos valores.
+CENARIOS = {
+    "teoria": [_pagina("Teoria")],
+    "calculadora_binomio": [
+        _pagina("Calculadora"),
+        _definir("text_input", "Primeiro termo (ex: x, 2*x, -y)", "2*x"),
+        _definir("text_input", "Segundo termo (ex: y, 3, 2*z)", "-3*y"),
+        _definir("slider", "Expoente", 200),
+    ],
+    "calculadora_multinomio": [
+        _pagina("Calculadora"),
+        _definir("radio", "Tipo de expansão", "Multinômio"),
+        _definir("text_input", "Termos separados por vírgula (ex: x, 2*y, -z)", "x, 2*y, -z, w"),
+        _definir("slider", "Expoente", 50),
+    ],
+    "coeficientes_tabela": [_pagina("Coeficientes"), _definir("number_input", "n", 20)],
+    "coeficientes_termo_geral": [
+        _pagina("Coeficientes"),
+        _definir("radio", "Modo", "Termo geral"),
+        _definir("text_input", "n", "100000"),
+        _definir("text_input", "k", "50000"),
+    ],
+    "coeficientes_grande_n": [
+        _pagina("Coeficientes"),
+        _definir("radio", "Modo", "Grande n"),
+        _definir("number_input", "n", 10 ** 7),
+    ],
+    "pascal_numeros": [_pagina("Triângulo de Pascal"), _definir("slider", "Número de linhas", 64)],
+    "pascal_cores": [
+        _pagina("Triângulo de Pascal"),
+        _definir("radio", "Modo de visualização", "Cores (mod p)"),
+        _definir("slider", "Número de linhas", 1024),
+    ],
+    "laboratorio": [
+        _pagina("Laboratório"),
+        _definir("checkbox", "Multiplicar por (cx + d)^m", True),
+        _definir("slider", "Expoente", 100),
+        _definir("slider", "Expoente m", 100),
+        _definir("select_slider", "Pontos amostrados", 100000),
+    ],
+    "passo_a_passo": [
+        _pagina("Passo a Passo"),
+        _definir("slider", "Expoente", 5),
+        _clicar("Expandir passo a passo"),
+    ],
+    "identificacao": [_pagina("Identificação de Binômios"), _clicar("Revelar resposta")],
+    "exercicios": [_pagina("Exercícios"), _clicar("Mostrar solução 4")],
+}
+
+
+def _rerun(at, passo):
+    passo(at)
+    inicio = time.perf_counter()
+    at.run(timeout=TEMPO_LIMITE)
+    duracao = time.perf_counter() - inicio
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    if any(MENSAGEM_LIMITE in erro.value for erro in at.error):
+        raise RuntimeError(MENSAGEM_LIMITE)
+    return duracao
+
+
+# O primeiro run do app dispara, em segundo plano, a importação dos módulos pesados e a
+# criação dos processos do pool; as medições só começam depois que ambas terminam, para
+# que a disputa pela CPU com esse aquecimento não entre na latência do primeiro cenário.
+def _abrir_app():
+    at = AppTest.from_file(APP, default_timeout=TEMPO_LIMITE)
+    at.run()
+    pre_aquecer().join()
+    for _ in range(pool_simbolico.processos):
+        pool_simbolico.executar(abs, 0)
+    return at
+
+
+def medir_cenario(nome, reruns):
+    at = _abrir_app()
+    passos = CENARIOS[nome]
+    for passo in passos[:-1]:
+        _rerun(at, passo)
+    frio = _rerun(at, passos[-1])
+    quentes = [_rerun(at, passos[-1]) for _ in range(reruns)]
+
+    cache_figuras.limpar()
+    cache_series.limpar()
+    tracemalloc.start()
+    _rerun(at, passos[-1])
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"frio_ms": round(frio * 1000, 1), "quente_ms": round(statistics.median(quentes) * 1000, 1),
+            "pico_mb": round(pico / 2 ** 20, 1)}
+
+
+def _quantil(ordenadas, q):
+    return ordenadas[max(0, round(q * len(ordenadas)) - 1)]
+
+
+# Uma sessão simulada: percorre todos os cenários, começando por um diferente em cada
+# sessão. O AppTest cria um runtime global do Streamlit a cada run e não pode rodar em
+# várias threads do mesmo processo, por isso cada sessão roda no seu próprio processo.
+# Um cenário que falha não entra nas latências; a sessão segue para o próximo.
+def _sessao(indice, nomes, reruns, barreira, fila):
+    latencias = {nome: [] for nome in nomes}
+    erros = []
+    at = _abrir_app()
+    barreira.wait()
+    inicio = time.time()
+    for deslocamento in range(len(nomes)):
+        nome = nomes[(indice + deslocamento) % len(nomes)]
+        passos = CENARIOS[nome]
+        try:
+            for passo in passos[:-1]:
+                _rerun(at, passo)
+            latencias[nome].extend([_rerun(at, passos[-1]) for _ in range(reruns)])
+        except Exception as excecao:
+            erros.append(f"sessão {indice}, {nome}: {excecao}")
+    fila.put((inicio, time.time(), latencias, erros, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+# N sessões em paralelo, liberadas juntas depois de carregar o app.
+def medir_concorrencia(nomes, sessoes, reruns):
+    contexto = multiprocessing.get_context("spawn")
+    barreira = contexto.Barrier(sessoes)
+    fila = contexto.Queue()
+    processos = [contexto.Process(target=_sessao, args=(i, nomes, reruns, barreira, fila)) for i in range(sessoes)]
+    for processo in processos:
+        processo.start()
+    respostas = [fila.get() for _ in processos]
+    for processo in processos:
+        processo.join()
+
+    latencias = {nome: [] for nome in nomes}
+    for _, _, parciais, _, _ in respostas:
+        for nome, valores in parciais.items():
+            latencias[nome].extend(valores)
+    total = max(r[1] for r in respostas) - min(r[0] for r in respostas)
+    resultado = {"sessoes": sessoes, "reruns_por_segundo": round(sum(map(len, latencias.values())) / total, 2),
+                 "rss_max_sessao_mb": round(max(r[4] for r in respostas), 1), "cenarios": {}}
+    for nome, valores in latencias.items():
+        if valores:
+            ordenadas = sorted(valores)
+            resultado["cenarios"][nome] = {f"p{q}_ms": round(_quantil(ordenadas, q / 100) * 1000, 1)
+                                         for q in (50, 95, 99)}
+    return resultado, [erro for r in respostas for erro in r[3]]
+
+
+def comparar(atual, base, tolerancia, prefixo=""):
+    regressoes = []
+    for chave, valor in atual.items():
+        anterior = base.get(chave) if isinstance(base, dict) else None
+        if isinstance(valor, dict):
+            regressoes += comparar(valor, anterior or {}, tolerancia, f"{prefixo}{chave}.")
+        elif isinstance(anterior, (int, float)) and anterior > 0 and chave.endswith(("_ms", "_mb")):
+            razao = valor / anterior
+            marca = "  <- regressão" if razao > tolerancia else ""
+            print(f"  {prefixo}{chave}: {anterior:.1f} -> {valor:.1f} ({razao:.2f}x){marca}")
+            if marca:
+                regressoes.append(f"{prefixo}{chave}")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark e teste de carga das páginas do app.")
+    parser.add_argument("--cenario", action="append", choices=sorted(CENARIOS), help="Cenários a executar (padrão: todos).")
+    parser.add_argument("--reruns", type=int, default=5, help="Reruns medidos por cenário.")
+    parser.add_argument("--sessoes", type=int, default=0, help="Simula N sessões em paralelo.")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--salvar-baseline", action="store_true")
+    parser.add_argument("--tolerancia", type=float, default=1.5, help="Razão atual/baseline aceita.")
+    args = parser.parse_args()
+
+    nomes = args.cenario or list(CENARIOS)
+    resultados = {}
+    erros = []
+    if args.sessoes:
+        concorrencia, erros = medir_concorrencia(nomes, args.sessoes, args.reruns)
+        print(f"{args.sessoes} sessões: {concorrencia['reruns_por_segundo']:.2f} reruns/s, "
+              f"RSS máximo por sessão {concorrencia['rss_max_sessao_mb']:.0f} MB")
+        print(f"{'cenário':<26} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for nome, linha in concorrencia["cenarios"].items():
+            print(f"{nome:<26} {linha['p50_ms']:>9.1f} {linha['p95_ms']:>9.1f} {linha['p99_ms']:>9.1f}")
+        resultados[f"concorrencia_{args.sessoes}"] = concorrencia
+    else:
+        print(f"{'cenário':<26} {'frio ms':>9} {'quente ms':>10} {'pico MB':>8}")
+        resultados["cenarios"] = {}
+        for nome in nomes:
+            try:
+                linha = medir_cenario(nome, args.reruns)
+            except Exception as excecao:
+                erros.append(f"{nome}: {excecao}")
+                continue
+            resultados["cenarios"][nome] = linha
+            print(f"{nome:<26} {linha['frio_ms']:>9.1f} {linha['quente_ms']:>10.1f} {linha['pico_mb']:>8.1f}")
+        print(f"RSS máximo do processo: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+    if erros:
+        for erro in erros:
+            print(erro, file=sys.stderr)
+        print(f"{len(erros)} cenários falharam.", file=sys.stderr)
+        return 1
+
+    base = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+
+    if args.salvar_baseline:
+        for chave, valor in resultados.items():
+            if chave == "cenarios":
+                base.setdefault("cenarios", {}).update(valor)
+            else:
+                base[chave] = valor
+        with open(args.baseline, "w", encoding="utf-8") as arquivo:
+            json.dump(base, arquivo, indent=2, ensure_ascii=False, sort_keys=True)
+            arquivo.write("\n")
+        print(f"Baseline gravado em {args.baseline}")
+        return 0
+
+    if base:
+        print(f"Comparação com {args.baseline}:")
+        regressoes = comparar(resultados, base, args.tolerancia)
+        if regressoes:
+            print(f"{len(regressoes)} medições acima de {args.tolerancia}x o baseline.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+# Compara a identificação de (ax + b)^n pela re-expansão com sympy (conferir um palpite
+# expandindo-o) com o resolvedor por razões entre coeficientes vizinhos, para n crescente.
+#
+#   python benchmarks/bench_identificacao.py
+import os
+import random
+import sys
+import time
+
+import sympy as sp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binomio.avaliacao import coeficientes_ax_b
+from binomio.identificacao import identificar, identificar_lote
+
+LIMITE_SYMPY = 500
+
+
+def cronometrar(func):
+    inicio = time.perf_counter()
+    func()
+    return time.perf_counter() - inicio
+
+
+def reexpandir(a, b, n, coefs):
+    x = sp.Symbol("x")
+    return sp.Poly(sp.expand((a * x + b) ** n), x).all_coeffs() == coefs
+
+
+if __name__ == "__main__":
+    print(f"{'n':>6} {'re-expansão':>13} {'resolvedor':>12}")
+    for n in (10, 100, 500, 2000, 10_000):
+        coefs = coeficientes_ax_b(3, -7, n)
+        t_sympy = cronometrar(lambda: reexpandir(3, -7, n, coefs)) if n <= LIMITE_SYMPY else float("nan")
+        t_novo = cronometrar(lambda: identificar(coefs))
+        print(f"{n:>6} {t_sympy * 1000:>10.2f} ms {t_novo * 1000:>9.2f} ms")
+
+    rng = random.Random(0)
+    banco = [coeficientes_ax_b(rng.randint(1, 15), rng.randint(-15, 15), rng.randint(2, 8)) for _ in range(100_000)]
+    tempo = cronometrar(lambda: sum(r is not None for r in identificar_lote(banco)))
+    print(f"lote de {len(banco)} exercícios: {tempo:.2f} s")
@@ -0,0 +1,34 @@
+# Mede o custo de inicialização a frio (processo novo a cada medição) do app e das
+# bibliotecas pesadas que agora são importadas apenas pelas páginas que as usam.
+#
+#   python benchmarks/bench_inicializacao.py [repeticoes]
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CENARIOS = [
+    ("interpretador", "pass"),
+    ("streamlit", "import streamlit"),
+    ("app (Teoria/Exercícios)", "import app"),
+    ("app + páginas interativas", "import app, binomio.inicializacao as i; i._importar(i.MODULOS_PESADOS)"),
+    ("app com imports no topo (antigo)", "import app, sympy, numpy, matplotlib.pyplot"),
+]
+
+
+def medir(codigo, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True)
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+if __name__ == "__main__":
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for nome, codigo in CENARIOS:
+        print(f"{nome:<35} {medir(codigo, repeticoes) * 1000:8.0f} ms")
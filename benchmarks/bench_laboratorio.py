@@ -0,0 +1,43 @@
+# Compara o custo por rerun do gráfico do Laboratório Virtual: substituição simbólica
+# ponto a ponto (versão antiga) vs. avaliação vetorizada da forma fatorada (a que a
+# página usa hoje), além do produto exato exibido como expansão.
+#
+#   python benchmarks/bench_laboratorio.py
+import os
+import sys
+import timeit
+
+import numpy as np
+import sympy as sp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binomio.polinomio import avaliar_produto, produto_binomios
+
+
+def antigo(a, b, n, pontos):
+    x = sp.Symbol('x')
+    expansion = sp.expand((a * x + b) ** n)
+    x_vals = np.linspace(-2, 2, pontos)
+    return [expansion.subs(x, val) for val in x_vals]
+
+
+def novo(fatores, pontos):
+    x_vals = np.linspace(-2, 2, pontos)
+    return avaliar_produto(fatores, x_vals)
+
+
+if __name__ == "__main__":
+    a, b, n = 1.5, -0.7, 10
+    repeticoes = 5
+    t_antigo = min(timeit.repeat(lambda: antigo(a, b, n, 100), number=1, repeat=repeticoes))
+    print(f"antigo  ({100:>9} pontos, subs):            {t_antigo * 1000:9.2f} ms")
+    for pontos in (100, 10_000, 100_000, 1_000_000):
+        t_novo = min(timeit.repeat(lambda: novo([(a, b, n)], pontos), number=1, repeat=repeticoes))
+        print(f"novo    ({pontos:>9} pontos, forma fatorada): {t_novo * 1000:9.2f} ms")
+
+    fatores = [(a, b, 60), (1.2, -1.0, 40)]
+    t_exato = min(timeit.repeat(lambda: produto_binomios(fatores), number=1, repeat=repeticoes))
+    print(f"produto exato (grau 100, Kronecker):       {t_exato * 1000:9.2f} ms")
+    t_fatorado = min(timeit.repeat(lambda: novo(fatores, 100_000), number=1, repeat=repeticoes))
+    print(f"forma fatorada (grau 100, 100000 pontos):  {t_fatorado * 1000:9.2f} ms")
@@ -0,0 +1,44 @@
+# Compara sp.expand com o motor multinomial (enumeração direta das composições e
+# coeficientes a partir de fatoriais em cache), para 3 a 5 termos e n até 50.
+#
+#   python benchmarks/bench_multinomio.py [--completo]
+#
+# Sem --completo, o sp.expand e a geração de todos os termos são pulados quando a
+# expansão passa de 50 000 termos.
+import os
+import sys
+import time
+
+import sympy as sp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binomio.multinomio import expandir_multinomio, numero_termos, pagina_multinomio
+
+LIMITE_SYMPY = 50_000
+
+
+def cronometrar(func):
+    inicio = time.perf_counter()
+    func()
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    completo = "--completo" in sys.argv
+    simbolos = sp.symbols("x y z w v")
+    print(f"{'m':>2} {'n':>3} {'termos':>8} {'sp.expand':>11} {'motor (todos)':>14} {'motor (1ª página)':>18}")
+    for m in (3, 4, 5):
+        termos = [(i + 1) * s for i, s in enumerate(simbolos[:m])]
+        for n in (10, 20, 30, 50):
+            total = numero_termos(n, m)
+            if completo or total <= LIMITE_SYMPY:
+                t_sympy = f"{cronometrar(lambda: sp.expand(sp.Add(*termos) ** n).as_ordered_terms()):10.3f}s"
+            else:
+                t_sympy = f"{'(pulado)':>11}"
+            if completo or total <= LIMITE_SYMPY:
+                t_todos = f"{cronometrar(lambda: list(expandir_multinomio(termos, n)[1])):13.3f}s"
+            else:
+                t_todos = f"{'(pulado)':>14}"
+            t_pagina = cronometrar(lambda: pagina_multinomio(termos, n, 0, 20))
+            print(f"{m:>2} {n:>3} {total:>8} {t_sympy} {t_todos} {t_pagina:17.4f}s")
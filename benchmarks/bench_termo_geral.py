@@ -0,0 +1,85 @@
+# Tempos das consultas ao termo geral de (ax + b)^n (exato, resto módulo p e magnitude) e conferência da magnitude em log10
+# contra mpmath com precisão suficiente, inclusive para n acima de 1e308, onde n não cabe
+# num float. Termina com código 1 se algum log10 divergir da referência.
+#
+#   python benchmarks/bench_termo_geral.py
+import os
+import sys
+import time
+
+import mpmath
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binomio.termo_geral import LIMITE_EXATO, _cache_exato, binomial_mod, magnitude_termo, resumo_termo_exato
+
+# (a, b, n, k): ramos da soma direta e de Stirling, com n abaixo e acima de 1e308.
+CASOS_MAGNITUDE = [
+    (2, -3, 10 ** 6, 500_000),
+    (1, 1, 10 ** 7, 3 * 10 ** 6),
+    (1, 1, 10 ** 310, 500),
+    (1, 1, 10 ** 310, 10 ** 6),
+    (1, 1, 10 ** 400, 10 ** 6),
+    (1, -3, 10 ** 400, 10 ** 6),
+    (1, 1, 4 * 10 ** 308, 10 ** 308),
+    (2, 1, 3 * 10 ** 308, 10 ** 6),
+]
+TOLERANCIA_RELATIVA = 1e-12
+
+# (a, b, n, k) do valor exato no limite LIMITE_EXATO, que deve ficar perto de 1 s.
+CASOS_EXATO = [(1, 1, LIMITE_EXATO, LIMITE_EXATO // 2), (-1000, 999, LIMITE_EXATO, LIMITE_EXATO // 2)]
+
+# (n, k, p): o pior caso do Teorema de Lucas é cada dígito de k na base p perto de p/2.
+P = 999_983
+CASOS_MOD = [
+    (10 ** 18, 500, P),
+    (P - 1, (P - 1) // 2, P),
+    (P ** 3 - 1, (P ** 3 - 1) // 2, P),
+]
+
+
+def log10_referencia(a, b, n, k):
+    with mpmath.workdps(len(str(n)) + 30):
+        n, k = mpmath.mpf(n), mpmath.mpf(k)
+        ln = mpmath.loggamma(n + 1) - mpmath.loggamma(k + 1) - mpmath.loggamma(n - k + 1)
+        ln += (n - k) * mpmath.log(abs(a)) + k * mpmath.log(abs(b))
+        return float(ln / mpmath.log(10))
+
+
+def _curto(valor):
+    texto = str(valor)
+    return texto if len(texto) <= 8 else f"{texto[0]}e{len(texto) - 1}"
+
+
+def cronometrar(func):
+    inicio = time.perf_counter()
+    resultado = func()
+    return resultado, time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    divergencias = 0
+    print(f"{'caso':<34} {'log10':>24} {'referência':>24} {'tempo':>9}")
+    for a, b, n, k in CASOS_MAGNITUDE:
+        (_, log10), tempo = cronometrar(lambda: magnitude_termo(a, b, n, k))
+        referencia = log10_referencia(a, b, n, k)
+        marca = ""
+        if abs(log10 - referencia) > TOLERANCIA_RELATIVA * abs(referencia):
+            marca = "  <- diverge"
+            divergencias += 1
+        caso = f"a={a} b={b} n={_curto(n)} k={_curto(k)}"
+        print(f"{caso:<34} {log10:>24.15e} {referencia:>24.15e} {tempo * 1000:>7.2f}ms{marca}")
+
+    print(f"\n{'exato':<34} {'dígitos':>24} {'tempo':>34}")
+    for a, b, n, k in CASOS_EXATO:
+        _cache_exato.clear()
+        resumo, tempo = cronometrar(lambda: resumo_termo_exato(a, b, n, k))
+        caso = f"a={a} b={b} n={_curto(n)} k={_curto(k)}"
+        print(f"{caso:<34} {resumo['digitos']:>24} {tempo * 1000:>32.2f}ms")
+
+    print(f"\n{'C(n, k) mod p':<34} {'resto':>24} {'tempo':>34}")
+    for n, k, p in CASOS_MOD:
+        resto, tempo = cronometrar(lambda: binomial_mod(n, k, p))
+        caso = f"n={_curto(n)} k={_curto(k)} p={p}"
+        print(f"{caso:<34} {resto:>24} {tempo * 1000:>32.2f}ms")
+    sys.exit(1 if divergencias else 0)
@@ -0,0 +1,57 @@
+# Teste de resistência do ciclo de vida das figuras: simula milhares de reruns
+# renderizando o gráfico de coeficientes e acompanha o RSS do processo.
+# Com pyplot sem plt.close o RSS cresce a cada rerun; com o gerenciador ele se estabiliza.
+#
+#   python benchmarks/soak_figuras.py [reruns] [--pyplot]
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binomio.figuras import figura_png, gerenciador_figuras
+from binomio.pascal import triangulo_compartilhado
+
+
+def rss_mb():
+    with open("/proc/self/statm") as statm:
+        paginas = int(statm.read().split()[1])
+    return paginas * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def rerun_gerenciador(n):
+    with gerenciador_figuras.figura("coeficientes") as fig:
+        ax = fig.subplots()
+        ax.bar(range(n + 1), list(triangulo_compartilhado.linha(n)))
+        return figura_png(fig)
+
+
+def rerun_pyplot(n):
+    import io
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    ax.bar(range(n + 1), list(triangulo_compartilhado.linha(n)))
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+if __name__ == "__main__":
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    reruns = int(argumentos[0]) if argumentos else 2000
+    rerun = rerun_pyplot if "--pyplot" in sys.argv else rerun_gerenciador
+
+    for _ in range(50):
+        rerun(10)
+    inicial = rss_mb()
+    print(f"{'reruns':>8} {'RSS (MB)':>10}")
+    for i in range(1, reruns + 1):
+        rerun(i % 21)
+        if i % (reruns // 10 or 1) == 0:
+            print(f"{i:>8} {rss_mb():>10.1f}")
+    crescimento = rss_mb() - inicial
+    print(f"crescimento após aquecimento: {crescimento:.1f} MB")
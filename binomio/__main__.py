@@ -0,0 +1,55 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import sys
+
+from binomio.nucleo import para_latex, processar
+
+# Processa pedidos em lote, um JSON por linha, sem abrir o navegador:
+#
+#   python -m binomio pedidos.jsonl -o respostas.jsonl
+#   echo '{"op": "expansao", "x": "2*x", "y": "3", "n": 4}' | python -m binomio --formato latex
+#
+# As linhas são lidas e escritas em lotes de tamanho fixo, distribuídos por um pool de
+# processos, de modo que a memória usada não depende do tamanho da entrada.
+
+
+def _processar_linha(linha):
+    try:
+        pedido = json.loads(linha)
+    except json.JSONDecodeError as erro:
+        return {}, {"erro": f"JSON inválido: {erro}"}
+    if not isinstance(pedido, dict):
+        return {}, {"erro": "Cada linha deve ser um objeto JSON."}
+    return pedido, processar(pedido)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m binomio", description="Expansões, coeficientes, linhas do "
+                                     "Triângulo de Pascal e identificação de binômios em lote (JSONL).")
+    parser.add_argument("entrada", nargs="?", type=argparse.FileType("r", encoding="utf-8"), default=sys.stdin,
+                        help="arquivo JSONL de pedidos (padrão: entrada padrão)")
+    parser.add_argument("-o", "--saida", type=argparse.FileType("w", encoding="utf-8"), default=sys.stdout,
+                        help="arquivo de saída (padrão: saída padrão)")
+    parser.add_argument("--formato", choices=["jsonl", "latex"], default="jsonl")
+    parser.add_argument("--processos", type=int, default=None, help="número de processos (padrão: núcleos da CPU)")
+    parser.add_argument("--lote", type=int, default=256, help="linhas processadas por lote")
+    args = parser.parse_args(argv)
+
+    linhas = (linha for linha in args.entrada if linha.strip())
+    with multiprocessing.Pool(args.processos) as pool:
+        while True:
+            lote = list(itertools.islice(linhas, args.lote))
+            if not lote:
+                break
+            for pedido, resposta in pool.imap(_processar_linha, lote, chunksize=max(1, args.lote // 16)):
+                if args.formato == "latex":
+                    args.saida.write(para_latex(pedido, resposta) + "\n")
+                else:
+                    args.saida.write(json.dumps(resposta, ensure_ascii=False) + "\n")
+            args.saida.flush()
+
+
+if __name__ == "__main__":
+    main()
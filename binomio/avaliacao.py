@@ -0,0 +1,112 @@
+from fractions import Fraction
+
+import numpy as np
+
+from binomio.pascal import triangulo_compartilhado
+
+
+# Coeficientes de (ax + b)^n do maior para o menor grau.
+def coeficientes_ax_b(a, b, n):
+    return [c * a ** (n - k) * b ** k for k, c in enumerate(triangulo_compartilhado.linha(n))]
+
+
+def _latex_numero(valor):
+    if isinstance(valor, Fraction) and valor.denominator != 1:
+        return rf"\frac{{{valor.numerator}}}{{{valor.denominator}}}"
+    return str(int(valor)) if isinstance(valor, Fraction) else str(valor)
+
+
+# LaTeX de um polinômio em x a partir dos coeficientes (do maior para o menor grau),
+# no mesmo formato de sp.latex, sem construir a expressão simbólica. Aceita inteiros
+# e Fraction.
+def latex_polinomio(coefs, variavel="x"):
+    n = len(coefs) - 1
+    partes = []
+    for i, c in enumerate(coefs):
+        if c == 0:
+            continue
+        grau = n - i
+        potencia = "" if grau == 0 else variavel if grau == 1 else f"{variavel}^{{{grau}}}"
+        valor = abs(c)
+        if potencia and valor == 1:
+            termo = potencia
+        elif potencia:
+            termo = f"{_latex_numero(valor)} {potencia}"
+        else:
+            termo = _latex_numero(valor)
+        if not partes:
+            partes.append(f"- {termo}" if c < 0 else termo)
+        else:
+            partes.append(f"{'-' if c < 0 else '+'} {termo}")
+    return " ".join(partes) if partes else "0"
+
+
+# log10 C(n, k) para k = 0..n como array NumPy, pela soma acumulada de
+# log10((n - k + 1) / k); funciona para n muito além do limite dos floats. As operações
+# são feitas no próprio array de saída para que n = 10^7 não aloque cinco cópias.
+def log10_linha(n):
+    k = np.arange(1, n + 1, dtype=float)
+    linha = np.empty(n + 1)
+    linha[0] = 0.0
+    cauda = linha[1:]
+    np.subtract(n + 1, k, out=cauda)
+    np.divide(cauda, k, out=cauda)
+    del k
+    np.log10(cauda, out=cauda)
+    np.cumsum(cauda, out=cauda)
+    return linha
+
+
+# Aproximação normal de log10 C(n, k): C(n, k) ≈ 2^n · N(k; n/2, n/4).
+def log10_normal(n, k):
+    k = np.asarray(k, dtype=float)
+    variancia = n / 4
+    return (n * np.log10(2) - 0.5 * np.log10(2 * np.pi * variancia)
+            - (k - n / 2) ** 2 / (2 * variancia) / np.log(10))
+
+
+# Reduz uma série a no máximo `baldes` pontos guardando o mínimo e o máximo de cada
+# balde, de modo que picos e vales continuam visíveis depois da redução.
+def reduzir_min_max(valores, baldes):
+    valores = np.asarray(valores)
+    if len(valores) <= baldes:
+        indices = np.arange(len(valores), dtype=float)
+        return indices, valores, valores
+    bordas = np.linspace(0, len(valores), baldes + 1).astype(int)
+    minimos = np.minimum.reduceat(valores, bordas[:-1])
+    maximos = np.maximum.reduceat(valores, bordas[:-1])
+    centros = (bordas[:-1] + bordas[1:] - 1) / 2
+    return centros, minimos, maximos
+
+
+# Pontos (x, y) para um gráfico de linha no navegador a partir da redução por baldes:
+# o mínimo e o máximo de cada balde viram dois pontos consecutivos no mesmo x.
+def intercalar_min_max(x, minimos, maximos):
+    if minimos is maximos:
+        return np.asarray(x), np.asarray(minimos)
+    return np.repeat(x, 2), np.column_stack((minimos, maximos)).ravel()
+
+
+# Reduz a série (x, y) a no máximo 2·baldes pontos para envio ao navegador: de cada
+# faixa de x ficam o mínimo e o máximo de y, preservando picos e o envelope da curva.
+def amostrar_para_grafico(x_vals, y_vals, baldes=1000):
+    centros, minimos, maximos = reduzir_min_max(y_vals, baldes)
+    return intercalar_min_max(np.interp(centros, np.arange(len(x_vals)), x_vals), minimos, maximos)
+
+
+# Série de C(n, k) para n grande, compartilhada pelo gráfico matplotlib e pelo interativo:
+# a linha em log10 (ou normalizada pelo coeficiente central em escala linear) reduzida a
+# `baldes` faixas de k, e a aproximação normal nos centros das faixas quando pedida.
+def serie_coeficientes_grandes(n, escala_log=True, normal=False, baldes=1000):
+    linha = log10_linha(n)
+    referencia = linha[n // 2]
+    if not escala_log:
+        linha -= referencia
+        np.power(10, linha, out=linha)
+    x, minimos, maximos = reduzir_min_max(linha, baldes)
+    aproximacao = None
+    if normal and n > 0:
+        aproximacao = log10_normal(n, x)
+        if not escala_log:
+            aproximacao = 10 ** (aproximacao - referencia)
+    return x, minimos, maximos, aproximacao
@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+
+
+# Cache LRU de figuras já rasterizadas (bytes PNG/SVG), chaveado por (página, parâmetros).
+# Ao ultrapassar o limite total de bytes, as figuras menos usadas recentemente saem primeiro.
+# `tamanho` mede os bytes de cada valor guardado; o padrão serve para bytes e str.
+class CacheFiguras:
+    def __init__(self, limite_bytes=32 * 1024 * 1024, tamanho=len):
+        self.limite_bytes = limite_bytes
+        self.tamanho = tamanho
+        self._figuras = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def obter(self, chave, renderizar):
+        with self._lock:
+            dados = self._figuras.get(chave)
+            if dados is not None:
+                self._figuras.move_to_end(chave)
+                return dados
+
+        dados = renderizar()
+
+        tamanho = self.tamanho(dados)
+        with self._lock:
+            if tamanho <= self.limite_bytes and chave not in self._figuras:
+                self._figuras[chave] = dados
+                self._total_bytes += tamanho
+                while self._total_bytes > self.limite_bytes:
+                    _, antigo = self._figuras.popitem(last=False)
+                    self._total_bytes -= self.tamanho(antigo)
+        return dados
+
+    def limpar(self):
+        with self._lock:
+            self._figuras.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._figuras)
+
+
+# Instância única por processo do servidor, compartilhada por todas as sessões.
+cache_figuras = CacheFiguras()
+
+
+def _bytes_series(dados):
+    return sum(getattr(valores, "nbytes", 0) for valores in dados.values())
+
+
+# Séries já reduzidas dos gráficos interativos ({coluna: array NumPy}), com as mesmas
+# chaves das figuras: um rerun com os mesmos parâmetros não recalcula a série inteira.
+cache_series = CacheFiguras(8 * 1024 * 1024, tamanho=_bytes_series)
@@ -0,0 +1,155 @@
+# Conteúdo das páginas estáticas (Teoria, explicação do Passo a Passo e Exercícios
+# Criativos). Cada página é uma lista de blocos (tipo, ...) usada tanto pelo app quanto
+# pela exportação para HTML estático (python -m binomio.estatico), para que os dois
+# nunca divirjam. Tipos: "cabecalho", "subtitulo", "texto" (markdown com $...$),
+# "formula" (LaTeX), "solucao" (rótulo do botão e o bloco revelado), "exercicio"
+# (número, enunciado e solução), "info" e "sucesso".
+
+TEORIA = [
+    ("cabecalho", "Teoria do Binômio de Newton"),
+    ("subtitulo", "O Básico e aplicações"),
+    ("texto", r"""
+    O Binômio de Newton é uma expressão algébrica que permite expandir potências de binômios de forma eficiente. 
+    A fórmula geral para $(x + y)^n$ é:
+    """),
+    ("formula", r"(x + y)^n = \sum_{k=0}^n \binom{n}{k} x^{n-k} y^k"),
+    ("texto", r"""
+    Onde:
+    - $n$ é o expoente do binômio
+    - $k$ é o índice da soma, variando de 0 a n
+    - $\binom{n}{k}$ é o coeficiente binomial, também conhecido como "n escolhe k"
+
+    O coeficiente binomial $\binom{n}{k}$ representa o número de maneiras de escolher $k$ itens de um conjunto de $n$ itens, e é calculado como:
+    """),
+    ("formula", r"\binom{n}{k} = \frac{n!}{k!(n-k)!}"),
+    ("texto", """
+    Aplicações do Binômio de Newton incluem:
+    1. Expansão de expressões algébricas
+    2. Cálculo de probabilidades em distribuições binomiais
+    3. Aproximações em física e engenharia
+    4. Teoria dos números e criptografia
+    """),
+    ("subtitulo", "Exemplo 1: Expansão de $(x + 1)^3$"),
+    ("solucao", "Mostrar solução exemplo 1", ("formula", r"(x + 1)^3 = x^3 + 3x^2 + 3x + 1")),
+    ("subtitulo", "Exemplo 2: Expansão de $(2x + y)^4$"),
+    ("solucao", "Mostrar solução exemplo 2", ("formula", r"(2x + y)^4 = 16x^4 + 32x^3y + 24x^2y^2 + 8xy^3 + y^4")),
+    ("info", "Dica: O Binômio de Newton é uma ferramenta poderosa para simplificar cálculos complexos em várias áreas da matemática e ciências aplicadas."),
+]
+
+EXPLICACAO_PASSO_A_PASSO = [
+    ("cabecalho", "Passo a Passo"),
+    ("subtitulo", "Como expandir e simplificar um binômio"),
+    ("texto", r"""
+    Antes de iniciar a parte interativa, é importante entender detalhadamente como expandir um binômio passo a passo.
+
+    ### Entendendo o Binômio de Newton
+
+    O Binômio de Newton é uma fórmula que permite expandir potências de binômios. A fórmula geral é:
+
+    $$(x + y)^n = \sum_{k=0}^n \binom{n}{k} x^{n-k} y^k$$
+
+    Onde:
+    - $n$ é o expoente do binômio
+    - $k$ é o índice da soma, variando de 0 a n
+    - $\binom{n}{k}$ é o coeficiente binomial, também conhecido como "n escolhe k"
+
+    ### Passo a Passo para Expandir um Binômio
+
+    Utiliza-se o exemplo $(a + b)^3$ para ilustrar o processo:
+
+    1. Identificação dos valores de $n$, $x$, e $y$:
+       - $n = 3$
+       - $x = a$
+       - $y = b$
+
+    2. Aplicação da fórmula para cada valor de $k$ de 0 a $n$:
+
+       - Para $k = 0$: $\binom{3}{0} a^3 b^0 = 1 \cdot a^3 \cdot 1 = a^3$
+       - Para $k = 1$: $\binom{3}{1} a^2 b^1 = 3 \cdot a^2 \cdot b = 3a^2b$
+       - Para $k = 2$: $\binom{3}{2} a^1 b^2 = 3 \cdot a \cdot b^2 = 3ab^2$
+       - Para $k = 3$: $\binom{3}{3} a^0 b^3 = 1 \cdot 1 \cdot b^3 = b^3$
+
+    3. Soma de todos os termos:
+
+       $(a + b)^3 = a^3 + 3a^2b + 3ab^2 + b^3$
+
+    Este é o resultado final da expansão.
+
+    ### Pontos Importantes a Serem Lembrados
+
+    - O número de termos na expansão será sempre $n + 1$.
+    - Os expoentes de $x$ diminuem de $n$ até 0, enquanto os de $y$ aumentam de 0 até $n$.
+    - Os coeficientes binomiais $\binom{n}{k}$ formam o Triângulo de Pascal.
+
+    Após compreender o processo, pode-se praticar com alguns exemplos interativos.
+    """),
+]
+
+EXERCICIOS_CRIATIVOS = [
+    {
+        "question": "Um jardim tem formato de triângulo equilátero. Se a cada ano o jardineiro aumenta o comprimento de cada lado em 1 metro, quantos metros quadrados o jardim terá aumentado após 3 anos?",
+        "solution": r"""
+        Seja $s$ o comprimento inicial do lado do jardim.
+        A área de um triângulo equilátero é dada por $A = \frac{\sqrt{3}}{4}s^2$.
+
+        Após 3 anos, o lado será $s+3$.
+        O aumento na área será:
+
+        $\Delta A = \frac{\sqrt{3}}{4}((s+3)^2 - s^2)$
+
+        $\Delta A = \frac{\sqrt{3}}{4}(s^2 + 6s + 9 - s^2)$
+
+        $\Delta A = \frac{\sqrt{3}}{4}(6s + 9)$
+
+        $\Delta A = \frac{3\sqrt{3}}{2}s + \frac{9\sqrt{3}}{4}$
+
+        Este é o aumento em metros quadrados após 3 anos.
+        """
+    },
+    {
+        "question": "Um vírus se multiplica a cada hora, dobrando sua população. Se inicialmente havia 100 vírus, quantos haverá após 8 horas?",
+        "solution": r"""
+        Este é um problema de crescimento exponencial que pode ser resolvido usando o Binômio de Newton.
+
+        A população após n horas será: $100 \cdot 2^n$
+
+        Para n = 8:
+
+        $100 \cdot 2^8 = 100 \cdot 256 = 25.600$
+
+        Portanto, após 8 horas, haverá 25.600 vírus.
+        """
+    },
+    {
+        "question": "Em um jogo de dados, qual é a probabilidade de obter exatamente 3 números pares em 5 lançamentos?",
+        "solution": r"""
+        Este é um problema de probabilidade binomial.
+
+        A probabilidade de obter um número par em um lançamento é 3/6 = 1/2.
+
+        Usamos o Binômio de Newton com n = 5 (total de lançamentos) e k = 3 (número de sucessos desejados).
+
+        $P(X = 3) = \binom{5}{3} (1/2)^3 (1/2)^2$
+
+        $= 10 \cdot (1/8) \cdot (1/4) = 10/32 = 5/16$
+
+        A probabilidade é 5/16 ou aproximadamente 0,3125 ou 31,25%.
+        """
+    },
+    {
+        "question": "Qual a expansão de $(3x + 2)^5$?",
+        "solution": r"""
+        A expansão de $(3x + 2)^5$ é:
+
+        $ = 243x^5 + 810x^4 + 1080x^3 + 720x^2 + 240x + 32$
+        """
+    }
+]
+
+EXERCICIOS = [
+    ("cabecalho", "Exercícios Criativos"),
+    ("subtitulo", "Hora da verdade!"),
+    *(("exercicio", i + 1, exercicio["question"], exercicio["solution"])
+      for i, exercicio in enumerate(EXERCICIOS_CRIATIVOS)),
+    ("sucesso", "Parabéns por enfrentar esses desafios! Lembre-se, a prática leva à perfeição em matemática. Abraços do monitor!"),
+]
@@ -0,0 +1,87 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+
+# Acima destes limites os rótulos numéricos e as arestas deixam de ser legíveis
+# e só custariam tempo de renderização.
+LIMITE_ROTULOS = 16
+LIMITE_ARESTAS = 64
+
+
+# Matriz (linhas x linhas) com C(i, j) mod p; posições fora do triângulo ficam mascaradas.
+def residuos_pascal(linhas, p):
+    residuos = np.zeros((linhas, linhas), dtype=np.int64)
+    residuos[0, 0] = 1
+    for i in range(1, linhas):
+        residuos[i, 0] = 1
+        residuos[i, 1:i + 1] = (residuos[i - 1, :i] + residuos[i - 1, 1:i + 1]) % p
+    fora = np.triu(np.ones((linhas, linhas), dtype=bool), k=1)
+    return np.ma.masked_array(residuos, mask=fora)
+
+
+# Todas as arestas entre uma célula (i, j), centrada em (j - i/2, -i), e as duas acima dela.
+def arestas_pascal(linhas):
+    i, j = np.tril_indices(linhas)
+    x, y = j - i / 2, -i.astype(float)
+    esquerda = (i > 0) & (j < i)
+    direita = (i > 0) & (j > 0)
+    segmentos = np.concatenate([
+        np.stack([np.column_stack([x[esquerda], y[esquerda]]),
+                  np.column_stack([x[esquerda] - 0.5, y[esquerda] + 1])], axis=1),
+        np.stack([np.column_stack([x[direita], y[direita]]),
+                  np.column_stack([x[direita] + 0.5, y[direita] + 1])], axis=1),
+    ])
+    return segmentos
+
+
+# Reorganiza a matriz de resíduos numa imagem em que cada célula ocupa duas
+# colunas, de modo que a linha i fique deslocada meia célula em relação à i-1.
+def _imagem_triangular(residuos):
+    linhas = residuos.shape[0]
+    imagem = np.ma.masked_all((linhas, 2 * linhas), dtype=residuos.dtype)
+    for i in range(linhas):
+        inicio = linhas - 1 - i
+        valores = np.repeat(residuos[i, :i + 1], 2)
+        imagem[i, inicio:inicio + 2 * (i + 1)] = valores
+    return imagem
+
+
+def desenhar_triangulo(ax, linhas, valores=None, modulo=None):
+    ax.set_axis_off()
+
+    if modulo is not None:
+        imagem = _imagem_triangular(residuos_pascal(linhas, modulo))
+        extensao = (-(linhas - 1) / 2 - 0.5, linhas / 2, -(linhas - 1) - 0.5, 0.5)
+        ax.imshow(imagem, cmap='viridis', vmin=0, vmax=modulo - 1, extent=extensao,
+                  aspect='auto', interpolation='nearest')
+
+    if linhas <= LIMITE_ARESTAS:
+        cor = 'white' if modulo is not None else 'black'
+        ax.add_collection(LineCollection(arestas_pascal(linhas), colors=cor, linewidths=1))
+
+    if valores is not None and linhas <= LIMITE_ROTULOS:
+        fonte = 14 if linhas <= 10 else 9
+        for i, row in enumerate(valores):
+            for j, num in enumerate(row):
+                ax.text(j - i / 2, -i, str(num), ha='center', va='center', fontweight='bold', fontsize=fonte)
+
+    ax.set_xlim(-(linhas - 1) / 2 - 0.5, (linhas - 1) / 2 + 0.5)
+    ax.set_ylim(-(linhas - 1) - 0.5, 0.5)
+
+
+# Gráfico de C(n, k) para n grande: a linha é calculada em log10 e reduzida a um número
+# fixo de baldes, então o custo de desenho não depende de n. Em escala linear os valores
+# são normalizados pelo coeficiente central.
+def desenhar_coeficientes_grandes(ax, n, escala_log=True, normal=False, baldes=1000):
+    from binomio.avaliacao import serie_coeficientes_grandes
+
+    x, minimos, maximos, aproximacao = serie_coeficientes_grandes(n, escala_log, normal, baldes)
+
+    ax.fill_between(x, minimos, maximos, step="mid", alpha=0.6, label=r"$\binom{n}{k}$")
+    ax.plot(x, maximos, lw=1)
+    if aproximacao is not None:
+        ax.plot(x, aproximacao, "--", color="tab:red", lw=1, label="Aproximação normal")
+        ax.legend()
+
+    ax.set_title(f"Coeficientes Binomiais para n={n}")
+    ax.set_xlabel("k")
+    ax.set_ylabel(r"$\log_{10} \binom{n}{k}$" if escala_log else r"$\binom{n}{k} / \binom{n}{n/2}$")
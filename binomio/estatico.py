@@ -0,0 +1,156 @@
+import argparse
+import base64
+import html
+import io
+import os
+import re
+import textwrap
+from functools import lru_cache
+
+from markdown_it import MarkdownIt
+from matplotlib import mathtext
+from matplotlib.font_manager import FontProperties
+
+from binomio.conteudo import EXERCICIOS, EXPLICACAO_PASSO_A_PASSO, TEORIA
+
+# Exporta as páginas de conteúdo fixo (Teoria, explicação do Passo a Passo e Exercícios
+# Criativos) como HTML estático, com as fórmulas já rasterizadas em SVG pelo mathtext do
+# matplotlib. O resultado não depende de Python nem de JavaScript e pode ser servido por
+# qualquer servidor web ou cache, deixando o Streamlit só para as páginas interativas.
+#
+#   python -m binomio.estatico site/
+
+PAGINAS = [
+    ("teoria.html", "Teoria", TEORIA),
+    ("passo_a_passo.html", "Passo a Passo", EXPLICACAO_PASSO_A_PASSO),
+    ("exercicios.html", "Exercícios", EXERCICIOS),
+]
+
+TAMANHO_FONTE = 14
+
+ESTILO = """
+body { font-family: sans-serif; max-width: 46rem; margin: 2rem auto; padding: 0 1rem; line-height: 1.6; color: #262730; }
+nav a { margin-right: 1rem; }
+.formula { text-align: center; margin: 1rem 0; }
+.info, .sucesso { padding: 1rem; border-radius: 0.5rem; margin: 1rem 0; }
+.info { background: #e8f2fc; }
+.sucesso { background: #e6f4ea; }
+details { border: 1px solid #ddd; border-radius: 0.5rem; padding: 0.5rem 1rem; margin: 0.5rem 0; }
+summary { cursor: pointer; }
+"""
+
+_markdown = MarkdownIt("commonmark")
+_MATEMATICA = re.compile(r"\$\$(.+?)\$\$|\$(.+?)\$", re.S)
+
+
+# Fórmula LaTeX como <img> com SVG embutido; a profundidade devolvida pelo mathtext
+# alinha a linha de base da fórmula com a do texto ao redor.
+@lru_cache(maxsize=None)
+def formula_html(latex, bloco=False):
+    buffer = io.BytesIO()
+    try:
+        profundidade = mathtext.math_to_image(f"${latex.strip()}$", buffer, prop=FontProperties(size=TAMANHO_FONTE),
+                                              format="svg")
+    except ValueError:
+        # Construção não suportada pelo mathtext: mantém o código LaTeX legível.
+        return f"<code>{html.escape(latex)}</code>"
+    dados = base64.b64encode(buffer.getvalue()).decode("ascii")
+    estilo = "" if bloco else f' style="vertical-align: -{profundidade:.1f}pt"'
+    return f'<img src="data:image/svg+xml;base64,{dados}" alt="{html.escape(latex)}"{estilo}>'
+
+
+# Markdown com $...$ e $$...$$: as fórmulas são trocadas por marcadores antes da
+# conversão (para que _ e * do LaTeX não virem ênfase) e depois pelas imagens.
+def texto_html(texto, inline=False):
+    formulas = []
+
+    def marcar(correspondencia):
+        exibida, embutida = correspondencia.groups()
+        formulas.append((exibida or embutida, exibida is not None))
+        return f"FORMULA{len(formulas) - 1}X"
+
+    marcado = _MATEMATICA.sub(marcar, textwrap.dedent(texto).strip())
+    convertido = _markdown.renderInline(marcado) if inline else _markdown.render(marcado)
+
+    def substituir(correspondencia):
+        latex, bloco = formulas[int(correspondencia.group(1))]
+        imagem = formula_html(latex, bloco)
+        return f'<span class="formula" style="display: block">{imagem}</span>' if bloco else imagem
+
+    return re.sub(r"FORMULA(\d+)X", substituir, convertido)
+
+
+def blocos_html(blocos):
+    partes = []
+    for bloco in blocos:
+        tipo = bloco[0]
+        if tipo == "cabecalho":
+            partes.append(f"<h1>{texto_html(bloco[1], inline=True)}</h1>")
+        elif tipo == "subtitulo":
+            partes.append(f"<h2>{texto_html(bloco[1], inline=True)}</h2>")
+        elif tipo == "texto":
+            partes.append(texto_html(bloco[1]))
+        elif tipo == "formula":
+            partes.append(f'<div class="formula">{formula_html(bloco[1], True)}</div>')
+        elif tipo == "solucao":
+            partes.append(f"<details><summary>{html.escape(bloco[1])}</summary>{blocos_html([bloco[2]])}</details>")
+        elif tipo == "exercicio":
+            numero, pergunta, solucao = bloco[1:]
+            partes.append(f"<h3>Exercício {numero}</h3>{texto_html(pergunta)}"
+                          f"<details><summary>Mostrar solução {numero}</summary>{texto_html(solucao)}</details>")
+        elif tipo in ("info", "sucesso"):
+            partes.append(f'<div class="{tipo}">{texto_html(bloco[1], inline=True)}</div>')
+    return "\n".join(partes)
+
+
+def documento(titulo, corpo, navegacao):
+    return f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(titulo)} - Binômio de Newton</title>
+<link rel="stylesheet" href="estilo.css">
+</head>
+<body>
+<nav>{navegacao}</nav>
+{corpo}
+<footer><p>Autores: João Renan S. Lopes E Pedro Girotto</p><p>Centro Universitário do Pará</p></footer>
+</body>
+</html>
+"""
+
+
+def exportar(destino, url_app=None):
+    os.makedirs(destino, exist_ok=True)
+    links = [f'<a href="{arquivo}">{html.escape(titulo)}</a>' for arquivo, titulo, _ in PAGINAS]
+    if url_app:
+        links.append(f'<a href="{html.escape(url_app)}">Páginas interativas</a>')
+    navegacao = " ".join(links)
+
+    arquivos = ["estilo.css", "index.html"]
+    with open(os.path.join(destino, "estilo.css"), "w", encoding="utf-8") as arquivo:
+        arquivo.write(ESTILO.lstrip())
+    for nome, titulo, blocos in PAGINAS:
+        with open(os.path.join(destino, nome), "w", encoding="utf-8") as arquivo:
+            arquivo.write(documento(titulo, blocos_html(blocos), navegacao))
+        arquivos.append(nome)
+
+    indice = "<h1>Binômio de Newton Interativo</h1><ul>" + "".join(f"<li>{link}</li>" for link in links) + "</ul>"
+    with open(os.path.join(destino, "index.html"), "w", encoding="utf-8") as arquivo:
+        arquivo.write(documento("Início", indice, navegacao))
+    return arquivos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m binomio.estatico",
+                                     description="Exporta as páginas de conteúdo fixo como HTML estático.")
+    parser.add_argument("destino", help="Diretório de saída.")
+    parser.add_argument("--url-app", help="Endereço do app Streamlit, para o link às páginas interativas.")
+    args = parser.parse_args(argv)
+    for nome in exportar(args.destino, args.url_app):
+        print(os.path.join(args.destino, nome))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import random
+from functools import lru_cache
+
+import sympy as sp
+
+from binomio.avaliacao import coeficientes_ax_b, latex_polinomio
+from binomio.pascal import triangulo_compartilhado
+
+TAMANHO_POOL = 50
+SEMENTE = 2024
+
+# Faixas de (a, b, n) de cada tipo/nível de exercício com binômios (ax + b)^n.
+NIVEIS = {
+    "expansao": {"a": (1, 5), "b": (1, 5), "n": (2, 4)},
+    "coeficiente": {"a": (1, 5), "b": (1, 5), "n": (4, 6)},
+    "Nivel 1": {"a": (1, 5), "b": (1, 5), "n": (2, 2)},
+    "Nivel 2": {"a": (1, 10), "b": (1, 10), "n": (3, 3)},
+    "Nivel 3": {"a": (1, 15), "b": (1, 15), "n": (4, 4)},
+}
+
+BINOMIOS_IDENTIFICACAO = [
+    ("x + 1", 2),
+    ("x - 2", 3),
+    ("2*x + 3", 2),
+    ("3*x - 1", 3),
+    ("x + y", 2),
+]
+
+
+def _exercicio_ax_b(a, b, n, k):
+    coefs = coeficientes_ax_b(a, b, n)
+    return {
+        "a": a,
+        "b": b,
+        "n": n,
+        "k": k,
+        "coeficientes": coefs,
+        "latex_binomio": rf"({a}x + {b})^{{{n}}}",
+        "latex_expansao": latex_polinomio(coefs),
+        "coeficiente": triangulo_compartilhado.coeficiente(n, k) * a ** (n - k) * b ** k,
+    }
+
+
+# Pool de exercícios de um tipo/nível, sorteado com semente fixa e calculado uma única
+# vez por processo: expansão, LaTeX e gabarito já prontos para consulta.
+@lru_cache(maxsize=None)
+def pool_exercicios(tipo):
+    rng = random.Random(f"{SEMENTE}-{tipo}")
+
+    if tipo == "identificacao":
+        x = sp.Symbol("x")
+        pool = []
+        for binomio, expoente in BINOMIOS_IDENTIFICACAO:
+            expr = sp.expand(sp.sympify(binomio) ** expoente)
+            # Coeficientes só existem para expressões apenas em x; servem para as dicas.
+            coefs = sp.Poly(expr, x).all_coeffs() if expr.free_symbols <= {x} else None
+            pool.append({"binomio": binomio, "expoente": expoente, "expr": expr,
+                         "latex_expansao": sp.latex(expr), "coeficientes": coefs})
+        return tuple(pool)
+
+    faixa = NIVEIS[tipo]
+    pool = []
+    for _ in range(TAMANHO_POOL):
+        a, b, n = (rng.randint(*faixa[campo]) for campo in ("a", "b", "n"))
+        pool.append(_exercicio_ax_b(a, b, n, rng.randint(1, n - 1)))
+    return tuple(pool)
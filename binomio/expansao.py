@@ -0,0 +1,54 @@
+from itertools import islice
+
+import sympy as sp
+
+from binomio.pascal import triangulo_compartilhado
+
+
+# Um termo é "simples" quando não contém somas internas (ex: 2*x, -y, 3),
+# caso em que C(n,k)·x^(n-k)·y^k já é um monômio na forma final.
+def _termo_simples(expr):
+    return not expr.has(sp.Add)
+
+
+# Os monômios gerados só são todos distintos quando os termos não compartilham
+# símbolos e no máximo um deles é constante.
+def caminho_direto(*termos):
+    if sum(1 for t in termos if not t.free_symbols) > 1:
+        return False
+    vistos = set()
+    for t in termos:
+        if vistos & t.free_symbols:
+            return False
+        vistos |= t.free_symbols
+    return all(_termo_simples(t) for t in termos)
+
+
+# Termos C(n,k)·x^(n-k)·y^k para k = 0..n, sem expandir nada.
+def termos_binomio(x, y, n):
+    return [c * x ** (n - k) * y ** k for k, c in enumerate(triangulo_compartilhado.linha(n))]
+
+
+# Expande (x + y)^n. Quando os termos não compartilham símbolos, os n+1 termos
+# saem diretamente do teorema binomial; caso contrário recorre ao sympy.
+def expandir_binomio(x, y, n):
+    if caminho_direto(x, y):
+        terms = [t for t in termos_binomio(x, y, n) if t != 0]
+        return sp.Add(*terms), terms
+    expansion = sp.expand((x + y) ** n)
+    return expansion, list(expansion.as_ordered_terms())
+
+
+# Gera os termos de (x + y)^n a partir da posição `inicio`, um a um, calculando
+# apenas os termos consumidos. Devolve (total de termos, gerador).
+def gerar_termos_binomio(x, y, n, inicio=0):
+    if caminho_direto(x, y) and x != 0 and y != 0:
+        linha = triangulo_compartilhado.linha(n)
+        return n + 1, (linha[k] * x ** (n - k) * y ** k for k in range(inicio, n + 1))
+    _, terms = expandir_binomio(x, y, n)
+    return len(terms), iter(terms[inicio:])
+
+
+def pagina_binomio(x, y, n, inicio=0, quantidade=None):
+    total, gerador = gerar_termos_binomio(x, y, n, inicio)
+    return total, list(islice(gerador, quantidade))
@@ -0,0 +1,54 @@
+import io
+import threading
+from contextlib import contextmanager
+
+from matplotlib import rcParams
+from matplotlib.figure import Figure
+
+from binomio.metricas import metricas
+
+
+# Entrega figuras da API orientada a objetos (sem o registro global do pyplot) e
+# garante que sejam limpas após o uso. Cada página mantém um pequeno pool de
+# figuras reaproveitáveis, evitando recriar o canvas a cada rerun.
+class GerenciadorFiguras:
+    def __init__(self, tamanho_pool=2):
+        self.tamanho_pool = tamanho_pool
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def figura(self, pagina, figsize=None):
+        with self._lock:
+            pool = self._pools.setdefault(pagina, [])
+            fig = pool.pop() if pool else None
+        if fig is None:
+            fig = Figure()
+        fig.set_size_inches(figsize or rcParams["figure.figsize"])
+        try:
+            yield fig
+        finally:
+            fig.clear()
+            with self._lock:
+                pool = self._pools.setdefault(pagina, [])
+                if len(pool) < self.tamanho_pool:
+                    pool.append(fig)
+
+
+# Largura máxima, em pixels, com que o st.image exibe uma imagem (MAXIMUM_CONTENT_WIDTH do
+# Streamlit). Um PNG mais largo é aberto, reduzido e recodificado pelo st.image a cada
+# rerun, mesmo vindo do cache de figuras.
+LARGURA_MAXIMA = 1460
+
+
+# PNG a 200 dpi, ou menos quando a figura passaria de LARGURA_MAXIMA (figsize 10 sai a 146 dpi).
+def figura_png(fig):
+    buffer = io.BytesIO()
+    dpi = min(200, LARGURA_MAXIMA // fig.get_figwidth())
+    with metricas.medir("figura"):
+        fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    return buffer.getvalue()
+
+
+# Instância única por processo do servidor.
+gerenciador_figuras = GerenciadorFiguras()
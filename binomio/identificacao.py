@@ -0,0 +1,51 @@
+from sympy import integer_nthroot
+
+# Recupera (ax + b)^n diretamente do vetor de coeficientes (grau decrescente), sem
+# expandir nenhum candidato: n vem do grau, |a| e |b| das raízes n-ésimas exatas dos
+# coeficientes extremos e os coeficientes do meio são conferidos numa única passada
+# pela razão entre vizinhos, c[k+1] / c[k] = (n - k) / (k + 1) · b / a.
+# São O(n) operações com inteiros grandes; nenhum C(n, k) nem potência é calculado.
+
+
+def raiz_exata(valor, n):
+    raiz, exata = integer_nthroot(abs(valor), n)
+    if not exata or (valor < 0 and n % 2 == 0):
+        return None
+    return -raiz if valor < 0 else raiz
+
+
+def _sinal(valor):
+    return (valor > 0) - (valor < 0)
+
+
+# (a, b, n) com (ax + b)^n igual aos coeficientes dados, ou None. Para n par (ax + b)^n
+# e (-ax - b)^n coincidem; devolve-se sempre a forma com a > 0.
+def identificar(coefs):
+    if any(c != int(c) for c in coefs):
+        return None
+    coefs = [int(c) for c in coefs]
+    inicio = next((i for i, c in enumerate(coefs) if c != 0), len(coefs))
+    coefs = coefs[inicio:]
+    n = len(coefs) - 1
+    if n < 1:
+        return None
+
+    a = raiz_exata(coefs[0], n)
+    b = raiz_exata(coefs[-1], n) if coefs[-1] else 0
+    if a is None or b is None:
+        return None
+    # O sinal de b sai de c[1] = n·a^(n-1)·b; quando o termo constante é negativo
+    # com n ímpar a raiz já veio com o sinal certo e a conferência abaixo o valida.
+    if b and _sinal(coefs[1]) != _sinal(a) ** (n - 1) * _sinal(b):
+        b = -b
+
+    for k in range(n):
+        if coefs[k + 1] * (k + 1) * a != coefs[k] * (n - k) * b:
+            return None
+    return a, b, n
+
+
+# Identifica vários vetores de uma vez (ex.: validar um banco de exercícios gerado).
+# Devolve um gerador para que lotes grandes não fiquem inteiros na memória.
+def identificar_lote(vetores):
+    return (identificar(coefs) for coefs in vetores)
@@ -0,0 +1,32 @@
+import importlib
+import threading
+
+# Módulos que carregam sympy, numpy e matplotlib. As páginas os importam sob demanda;
+# depois da primeira renderização eles são pré-carregados em segundo plano para que
+# a primeira visita a uma página interativa não pague o custo da importação.
+MODULOS_PESADOS = (
+    "binomio.avaliacao",
+    "binomio.desenho",
+    "binomio.exercicios",
+    "binomio.figuras",
+    "binomio.nucleo",
+    "binomio.polinomio",
+    "binomio.verificacao",
+)
+
+_lock = threading.Lock()
+_thread = None
+
+
+def _importar(modulos):
+    for nome in modulos:
+        importlib.import_module(nome)
+
+
+def pre_aquecer(modulos=MODULOS_PESADOS):
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_importar, args=(modulos,), name="pre-aquecimento", daemon=True)
+            _thread.start()
+    return _thread
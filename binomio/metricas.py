@@ -0,0 +1,114 @@
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+QUANTIS = (0.5, 0.95, 0.99)
+
+# Caminho do arquivo de exportação (".prom" gera um textfile do Prometheus; qualquer
+# outro sufixo, uma linha JSONL por página/fase a cada exportação). Sem ele, nada é escrito.
+CAMINHO_EXPORTACAO = os.environ.get("BINOMIO_METRICAS")
+INTERVALO_EXPORTACAO = float(os.environ.get("BINOMIO_METRICAS_INTERVALO", "30"))
+
+
+def _quantil(ordenadas, q):
+    return ordenadas[max(0, math.ceil(q * len(ordenadas)) - 1)]
+
+
+# Tempos por (página, fase). Cada série guarda as últimas `amostras` medições para os
+# percentis, além de contagem e soma totais. As medições do rerun atual ficam também
+# numa lista por thread (o Streamlit executa cada rerun numa thread própria), usada pelo
+# painel de depuração.
+class Metricas:
+    def __init__(self, amostras=2048):
+        self.amostras = amostras
+        self._series = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ultima_exportacao = time.monotonic()
+
+    def iniciar_rerun(self, pagina=None):
+        self._local.pagina = pagina
+        self._local.medicoes = []
+
+    def medicoes_rerun(self):
+        return list(getattr(self._local, "medicoes", None) or [])
+
+    def registrar(self, fase, segundos, pagina=None):
+        pagina = pagina or getattr(self._local, "pagina", None) or "-"
+        medicoes = getattr(self._local, "medicoes", None)
+        if medicoes is not None:
+            medicoes.append((pagina, fase, segundos))
+        with self._lock:
+            serie = self._series.get((pagina, fase))
+            if serie is None:
+                serie = self._series[(pagina, fase)] = [deque(maxlen=self.amostras), 0, 0.0]
+            serie[0].append(segundos)
+            serie[1] += 1
+            serie[2] += segundos
+
+    @contextmanager
+    def medir(self, fase, pagina=None):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(fase, time.perf_counter() - inicio, pagina)
+
+    def resumo(self):
+        with self._lock:
+            series = [(chave, sorted(amostras), contagem, soma)
+                      for chave, (amostras, contagem, soma) in self._series.items()]
+        linhas = []
+        for (pagina, fase), ordenadas, contagem, soma in sorted(series):
+            linha = {"pagina": pagina, "fase": fase, "contagem": contagem, "soma": soma}
+            for q in QUANTIS:
+                linha[f"p{round(q * 100)}"] = _quantil(ordenadas, q)
+            linhas.append(linha)
+        return linhas
+
+    def exportar_jsonl(self, caminho):
+        instante = time.time()
+        with open(caminho, "a", encoding="utf-8") as arquivo:
+            for linha in self.resumo():
+                arquivo.write(json.dumps({"instante": instante, **linha}, ensure_ascii=False) + "\n")
+
+    # Formato "summary" do Prometheus, escrito num arquivo temporário e renomeado para
+    # que o node_exporter nunca leia um arquivo pela metade.
+    def exportar_prometheus(self, caminho):
+        linhas = ["# HELP binomio_latencia_segundos Tempo por página e fase do app.",
+                  "# TYPE binomio_latencia_segundos summary"]
+        for linha in self.resumo():
+            rotulos = f'pagina="{linha["pagina"]}",fase="{linha["fase"]}"'
+            for q in QUANTIS:
+                linhas.append(f'binomio_latencia_segundos{{{rotulos},quantile="{q}"}} {linha[f"p{round(q * 100)}"]:.6f}')
+            linhas.append(f"binomio_latencia_segundos_sum{{{rotulos}}} {linha['soma']:.6f}")
+            linhas.append(f"binomio_latencia_segundos_count{{{rotulos}}} {linha['contagem']}")
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            arquivo.write("\n".join(linhas) + "\n")
+        os.replace(temporario, caminho)
+
+    def exportar(self, caminho):
+        if caminho.endswith(".prom"):
+            self.exportar_prometheus(caminho)
+        else:
+            self.exportar_jsonl(caminho)
+
+    # Chamado ao fim de cada rerun: exporta no máximo uma vez a cada `intervalo` segundos.
+    def exportar_periodicamente(self, caminho=CAMINHO_EXPORTACAO, intervalo=INTERVALO_EXPORTACAO):
+        if not caminho:
+            return
+        with self._lock:
+            agora = time.monotonic()
+            if agora - self._ultima_exportacao < intervalo:
+                return
+            self._ultima_exportacao = agora
+        self.exportar(caminho)
+
+
+# Instância única por processo do servidor.
+metricas = Metricas()
@@ -0,0 +1,73 @@
+import math
+import threading
+from itertools import islice
+
+import sympy as sp
+
+from binomio.expansao import caminho_direto
+
+_fatoriais = [1]
+_lock = threading.Lock()
+
+
+# Fatoriais calculados uma única vez por processo e estendidos sob demanda.
+def fatorial(n):
+    if n >= len(_fatoriais):
+        with _lock:
+            for i in range(len(_fatoriais), n + 1):
+                _fatoriais.append(_fatoriais[-1] * i)
+    return _fatoriais[n]
+
+
+def coeficiente_multinomial(expoentes):
+    resultado = fatorial(sum(expoentes))
+    for k in expoentes:
+        resultado //= fatorial(k)
+    return resultado
+
+
+# Todas as tuplas (k1, ..., km) de inteiros não negativos com soma n, em ordem
+# lexicográfica decrescente: x1^n vem primeiro, como na escrita usual. Com `inicio`
+# a geração começa direto na tupla dessa posição, pulando blocos inteiros pela contagem.
+def composicoes(n, m, inicio=0):
+    if m == 1:
+        if inicio == 0:
+            yield (n,)
+        return
+    for k in range(n, -1, -1):
+        bloco = numero_termos(n - k, m - 1)
+        if inicio >= bloco:
+            inicio -= bloco
+            continue
+        for resto in composicoes(n - k, m - 1, inicio):
+            yield (k,) + resto
+        inicio = 0
+
+
+def numero_termos(n, m):
+    return math.comb(n + m - 1, m - 1)
+
+
+def _monomio(termos, expoentes):
+    return coeficiente_multinomial(expoentes) * sp.Mul(*(t ** k for t, k in zip(termos, expoentes)))
+
+
+# Gera os termos de (t1 + ... + tm)^n um a um, a partir da posição `inicio`, sem
+# materializar a expansão. Devolve (total de termos, gerador). Se os termos
+# compartilham símbolos os monômios se combinam, e a expansão é feita pelo sympy.
+def expandir_multinomio(termos, n, inicio=0):
+    termos = [sp.sympify(t) for t in termos]
+    termos = [t for t in termos if t != 0]
+    if not termos:
+        return 1, iter([sp.Integer(0 ** n)][inicio:])
+    if caminho_direto(*termos):
+        gerador = (_monomio(termos, ks) for ks in composicoes(n, len(termos), inicio))
+        return numero_termos(n, len(termos)), gerador
+    expansion = sp.expand(sp.Add(*termos) ** n)
+    terms = expansion.as_ordered_terms()
+    return len(terms), iter(terms[inicio:])
+
+
+def pagina_multinomio(termos, n, inicio=0, quantidade=None):
+    total, gerador = expandir_multinomio(termos, n, inicio)
+    return total, list(islice(gerador, quantidade))
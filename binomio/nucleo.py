@@ -0,0 +1,164 @@
+import sympy as sp
+
+from binomio.expansao import expandir_binomio, pagina_binomio, termos_binomio
+from binomio.identificacao import identificar
+from binomio.metricas import metricas
+from binomio.multinomio import pagina_multinomio
+from binomio.pascal import triangulo_compartilhado
+
+# Núcleo de cálculo independente da interface: usado pelas páginas do Streamlit (via
+# pool de processos) e pela linha de comando (python -m binomio). Todas as operações
+# recebem valores simples (texto, inteiros) e devolvem dicionários serializáveis em JSON.
+# binomio.avaliacao (que carrega numpy) só é importado em para_latex, para que os
+# processos do pool, que importam este módulo, não carreguem numpy/OpenBLAS.
+
+
+# Soma de termos já em LaTeX, na ordem dada: "a", "- b" -> "a - b".
+def latex_soma(termos):
+    partes = []
+    for termo in termos:
+        if not partes:
+            partes.append(termo)
+        elif termo.startswith("-"):
+            partes.append(f"- {termo[1:].lstrip()}")
+        else:
+            partes.append(f"+ {termo}")
+    return " ".join(partes) if partes else "0"
+
+
+def _validar_inteiros(**valores):
+    for nome, valor in valores.items():
+        if isinstance(valor, bool) or not isinstance(valor, int) or valor < 0:
+            raise ValueError(f"'{nome}' deve ser um inteiro não negativo, recebido {valor!r}.")
+
+
+# Termos de (x + y)^n a partir de `inicio`. Sem `quantidade` devolve todos os termos e
+# também o LaTeX da expansão completa; com `quantidade` só a página pedida é gerada.
+def expansao(x, y, n, inicio=0, quantidade=None):
+    _validar_inteiros(n=n, inicio=inicio, **({} if quantidade is None else {"quantidade": quantidade}))
+    with metricas.medir("parse"):
+        x_expr, y_expr = sp.sympify(x), sp.sympify(y)
+    with metricas.medir("calculo"):
+        total, terms = pagina_binomio(x_expr, y_expr, n, inicio, quantidade)
+    with metricas.medir("latex"):
+        resultado = {"total": total, "inicio": inicio, "termos": [sp.latex(term) for term in terms]}
+        if quantidade is None:
+            resultado["latex"] = latex_soma(resultado["termos"])
+    return resultado
+
+
+def passos(x, y, n):
+    _validar_inteiros(n=n)
+    with metricas.medir("parse"):
+        x_expr, y_expr = sp.sympify(x), sp.sympify(y)
+    with metricas.medir("calculo"):
+        expansion, _ = expandir_binomio(x_expr, y_expr, n)
+        terms = termos_binomio(x_expr, y_expr, n)
+    with metricas.medir("latex"):
+        return {"passos": [sp.latex(term) for term in terms], "latex": sp.latex(expansion)}
+
+
+# Uma página dos termos de (t1 + ... + tm)^n e o total de termos, sem gerar os demais.
+def multinomio(termos, n, inicio=0, quantidade=None):
+    _validar_inteiros(n=n, inicio=inicio, **({} if quantidade is None else {"quantidade": quantidade}))
+    if isinstance(termos, str):
+        termos = [t for t in termos.split(",") if t.strip()]
+    with metricas.medir("parse"):
+        exprs = [sp.sympify(t) for t in termos]
+    with metricas.medir("calculo"):
+        total, pagina = pagina_multinomio(exprs, n, inicio, quantidade)
+    with metricas.medir("latex"):
+        return {"total": total, "inicio": inicio, "termos": [sp.latex(term) for term in pagina]}
+
+
+def coeficientes(n):
+    _validar_inteiros(n=n)
+    return {"coeficientes": list(triangulo_compartilhado.linha(n))}
+
+
+def pascal(linhas):
+    _validar_inteiros(linhas=linhas)
+    return {"linhas": [list(linha) for linha in triangulo_compartilhado.linhas(linhas)]}
+
+
+# Recupera (ax + b)^n de um polinômio em x com coeficientes inteiros, dado como
+# expressão ou como vetor de coeficientes em grau decrescente.
+def identificacao(expressao=None, coeficientes=None):
+    if expressao is None and coeficientes is None:
+        raise ValueError("Informe 'expressao' ou 'coeficientes'.")
+    if coeficientes is None:
+        coeficientes = sp.Poly(sp.sympify(expressao), sp.Symbol("x")).all_coeffs()
+    resultado = identificar(coeficientes)
+    if resultado is None:
+        raise ValueError("A expressão não é a potência de um binômio (ax + b)^n com coeficientes inteiros.")
+    a, b, n = resultado
+    return {"a": a, "b": b, "n": n}
+
+
+OPERACOES = {
+    "expansao": expansao,
+    "passos": passos,
+    "multinomio": multinomio,
+    "coeficientes": coeficientes,
+    "pascal": pascal,
+    "identificacao": identificacao,
+}
+
+
+# Executa um pedido {"op": ..., <argumentos>} e devolve o resultado com o mesmo "id".
+# Qualquer erro do pedido vira {"erro": ...} para que uma linha inválida não interrompa
+# o lote inteiro (sympy levanta desde SympifyError até AttributeError e PolynomialError).
+def processar(pedido):
+    resposta = {"id": pedido["id"]} if "id" in pedido else {}
+    argumentos = {chave: valor for chave, valor in pedido.items() if chave not in ("id", "op")}
+    try:
+        operacao = OPERACOES[pedido.get("op")]
+    except KeyError:
+        resposta["erro"] = f"Operação desconhecida: {pedido.get('op')!r}"
+        return resposta
+    try:
+        resposta.update(operacao(**argumentos))
+    except Exception as erro:
+        resposta["erro"] = str(erro) or type(erro).__name__
+    return resposta
+
+
+# LaTeX da soma devolvida; quando o pedido trouxe só uma página dos termos, os termos
+# omitidos antes e depois dela aparecem como \cdots.
+def _latex_resultado(resposta):
+    if "latex" in resposta:
+        return resposta["latex"]
+    soma = latex_soma(resposta["termos"])
+    if resposta.get("inicio", 0) > 0:
+        soma = r"\cdots + " + soma
+    if resposta.get("inicio", 0) + len(resposta["termos"]) < resposta.get("total", 0):
+        soma += r" + \cdots"
+    return soma
+
+
+# Base da potência em LaTeX a partir dos termos digitados: (2*x, -3) -> "2 x - 3".
+def _latex_base(termos):
+    return sp.latex(sp.Add(*(sp.sympify(t) for t in termos), evaluate=False))
+
+
+# Representação LaTeX de um resultado, usada para montar folhas de exercícios e gabaritos.
+def para_latex(pedido, resposta):
+    from binomio.avaliacao import coeficientes_ax_b, latex_polinomio
+
+    if "erro" in resposta:
+        return "% erro: " + " ".join(resposta["erro"].split())
+    op = pedido["op"]
+    if op in ("expansao", "passos"):
+        base = _latex_base([pedido["x"], pedido["y"]])
+        return rf"({base})^{{{pedido['n']}}} = {_latex_resultado(resposta)}"
+    if op == "multinomio":
+        termos = pedido["termos"]
+        if isinstance(termos, str):
+            termos = [t for t in termos.split(",") if t.strip()]
+        return rf"({_latex_base(termos)})^{{{pedido['n']}}} = {_latex_resultado(resposta)}"
+    if op == "coeficientes":
+        return rf"\binom{{{pedido['n']}}}{{k}}: " + ", ".join(map(str, resposta["coeficientes"]))
+    if op == "pascal":
+        return r" \\ ".join(" & ".join(map(str, linha)) for linha in resposta["linhas"])
+    a, b, n = resposta["a"], resposta["b"], resposta["n"]
+    return rf"{latex_polinomio(coeficientes_ax_b(a, b, n))} = ({latex_polinomio([a, b])})^{{{n}}}"
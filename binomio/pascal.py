@@ -0,0 +1,82 @@
+import sys
+import threading
+from array import array
+
+MAIOR_UINT64 = 2 ** 64 - 1
+
+
+# Linha n do Triângulo de Pascal calculada de forma incremental:
+# C(n, k+1) = C(n, k) * (n - k) / (k + 1)
+def linha_pascal(n):
+    linha = [1]
+    for k in range(n):
+        linha.append(linha[-1] * (n - k) // (k + 1))
+    return linha
+
+
+# Linhas cujo maior valor (o central) cabe em 64 bits são guardadas num array
+# compacto; as demais ficam como tupla de inteiros do Python.
+def _compactar(linha):
+    if linha[len(linha) // 2] <= MAIOR_UINT64:
+        return array('Q', linha)
+    return tuple(linha)
+
+
+def _tamanho(linha):
+    if isinstance(linha, array):
+        return sys.getsizeof(linha)
+    return sys.getsizeof(linha) + sum(sys.getsizeof(v) for v in linha)
+
+
+# Armazena linhas do Triângulo de Pascal compartilhadas entre sessões e threads.
+# Uma linha nova é derivada da anterior quando ela já está em cache; ao passar do
+# limite de memória, as linhas de maior n são descartadas primeiro.
+class TrianguloPascal:
+    def __init__(self, limite_bytes=64 * 1024 * 1024):
+        self.limite_bytes = limite_bytes
+        self._linhas = {}
+        self._tamanhos = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def linha(self, n):
+        with self._lock:
+            linha = self._linhas.get(n)
+            if linha is None:
+                anterior = self._linhas.get(n - 1)
+                if anterior is not None:
+                    nova = [1] + [anterior[k - 1] + anterior[k] for k in range(1, n)] + [1]
+                else:
+                    nova = linha_pascal(n)
+                linha = self._guardar(n, nova)
+            return linha
+
+    def linhas(self, quantidade):
+        return [self.linha(i) for i in range(quantidade)]
+
+    def coeficiente(self, n, k):
+        if k < 0 or k > n:
+            return 0
+        return self.linha(n)[k]
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def _guardar(self, n, linha):
+        linha = _compactar(linha)
+        tamanho = _tamanho(linha)
+        if tamanho > self.limite_bytes:
+            return linha
+        self._linhas[n] = linha
+        self._tamanhos[n] = tamanho
+        self._total_bytes += tamanho
+        while self._total_bytes > self.limite_bytes:
+            maior = max(m for m in self._linhas if m != n)
+            del self._linhas[maior]
+            self._total_bytes -= self._tamanhos.pop(maior)
+        return linha
+
+
+# Instância única por processo do servidor: todas as sessões compartilham as mesmas linhas.
+triangulo_compartilhado = TrianguloPascal()
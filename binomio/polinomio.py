@@ -0,0 +1,69 @@
+import math
+from fractions import Fraction
+from functools import reduce
+
+import numpy as np
+
+from binomio.pascal import triangulo_compartilhado
+
+# Polinômios em x representados por vetores de coeficientes exatos (Fraction), do maior
+# para o menor grau, para exibição; os gráficos usam arrays float do NumPy.
+
+
+def fracao(valor):
+    # str(float) é a representação decimal mais curta: 0.1 vira 1/10, não 3602879701896397/2^55.
+    return Fraction(str(valor)) if isinstance(valor, float) else Fraction(valor)
+
+
+def binomio_exato(a, b, n):
+    a, b = fracao(a), fracao(b)
+    return [c * a ** (n - k) * b ** k for k, c in enumerate(triangulo_compartilhado.linha(n))]
+
+
+def _inteiros(p):
+    denominador = math.lcm(*(c.denominator for c in p))
+    return [int(c * denominador) for c in p], denominador
+
+
+# Produto exato por substituição de Kronecker: cada polinômio com coeficientes inteiros
+# vira um único inteiro (seus coeficientes em "dígitos" de B bits), e uma só
+# multiplicação de inteiros grandes do Python faz a convolução inteira.
+def _multiplicar_inteiros(p, q):
+    limite = max(map(abs, p)) * max(map(abs, q)) * min(len(p), len(q))
+    bits = limite.bit_length() + 2
+    empacotar = lambda coefs: sum(c << (bits * i) for i, c in enumerate(reversed(coefs)))
+    valor = empacotar(p) * empacotar(q)
+    mascara, metade = (1 << bits) - 1, 1 << (bits - 1)
+    produto = []
+    for _ in range(len(p) + len(q) - 1):
+        digito = valor & mascara
+        if digito >= metade:
+            digito -= 1 << bits
+        produto.append(digito)
+        valor = (valor - digito) >> bits
+    return produto[::-1]
+
+
+def multiplicar_exato(p, q):
+    p, q = [fracao(c) for c in p], [fracao(c) for c in q]
+    if not any(p) or not any(q):
+        return [Fraction(0)] * (len(p) + len(q) - 1)
+    (p_int, den_p), (q_int, den_q) = _inteiros(p), _inteiros(q)
+    denominador = den_p * den_q
+    return [Fraction(c, denominador) for c in _multiplicar_inteiros(p_int, q_int)]
+
+
+# Coeficientes exatos do produto de vários binômios (a, b, n): (ax + b)^n · (cx + d)^m · ...
+def produto_binomios(fatores):
+    return reduce(multiplicar_exato, (binomio_exato(a, b, n) for a, b, n in fatores), [Fraction(1)])
+
+
+# Valores do produto nos pontos x_vals, calculados na forma fatorada (ax + b)^n.
+# Em grau alto, avaliar os coeficientes expandidos em float sofre cancelamento
+# catastrófico (termos de 10^30 somando um valor de 10^11), o que não ocorre aqui.
+def avaliar_produto(fatores, x_vals):
+    x_vals = np.asarray(x_vals, dtype=float)
+    valores = np.ones_like(x_vals)
+    for a, b, n in fatores:
+        valores *= (a * x_vals + b) ** n
+    return valores
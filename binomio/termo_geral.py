@@ -0,0 +1,145 @@
+import math
+import threading
+from collections import OrderedDict
+
+# Consultas ao k-ésimo termo de (ax + b)^n, C(n,k)·a^(n-k)·b^k (coeficiente de x^(n-k)),
+# sem expandir o binômio: valor exato, resto módulo um primo p e magnitude em log10.
+
+# No limite, com k = n/2 e |a|, |b| perto de 1000, o valor exato leva cerca de 0,7 s (são
+# ~330 mil dígitos); n = 10^6 já passaria de 20 s, muito além do tempo limite do pool.
+LIMITE_EXATO = 10 ** 5
+LIMITE_PRIMO = 10 ** 6
+DIGITOS_COMPLETOS = 4000
+
+_cache_exato = OrderedDict()
+_lock = threading.Lock()
+
+
+# C(n, k) exato. Valores recentes ficam em cache; uma consulta vizinha (k ± 1 ou n ± 1)
+# é derivada do valor em cache com uma multiplicação e uma divisão:
+# C(n, k+1) = C(n, k)·(n-k)/(k+1) e C(n+1, k) = C(n, k)·(n+1)/(n+1-k).
+def binomial_exato(n, k):
+    if k < 0 or k > n:
+        return 0
+    with _lock:
+        valor = _cache_exato.get((n, k))
+        if valor is None:
+            if (n, k - 1) in _cache_exato:
+                valor = _cache_exato[(n, k - 1)] * (n - k + 1) // k
+            elif (n, k + 1) in _cache_exato:
+                valor = _cache_exato[(n, k + 1)] * (k + 1) // (n - k)
+            elif (n - 1, k) in _cache_exato:
+                valor = _cache_exato[(n - 1, k)] * n // (n - k)
+            else:
+                valor = math.comb(n, k)
+            _cache_exato[(n, k)] = valor
+            while len(_cache_exato) > 32:
+                _cache_exato.popitem(last=False)
+        else:
+            _cache_exato.move_to_end((n, k))
+    return valor
+
+
+def termo_exato(a, b, n, k):
+    if n > LIMITE_EXATO:
+        raise ValueError(f"O cálculo exato aceita n até {LIMITE_EXATO}; use o resultado módulo p ou a magnitude.")
+    return binomial_exato(n, k) * a ** (n - k) * b ** k
+
+
+def _primo(p):
+    if p < 2:
+        return False
+    return all(p % d for d in range(2, math.isqrt(p) + 1))
+
+
+# C(n, k) mod p para 0 <= k <= n < p, pelo produto (n/1)·((n-1)/2)···, com uma única
+# inversão modular no fim. São O(min(k, n-k)) multiplicações e nenhuma tabela de tamanho p.
+def _binomial_digito_mod(n, k, p):
+    numerador = denominador = 1
+    for i in range(min(k, n - k)):
+        numerador = numerador * (n - i) % p
+        denominador = denominador * (i + 1) % p
+    return numerador * pow(denominador, p - 2, p) % p
+
+
+# C(n, k) mod p pelo Teorema de Lucas: o produto dos C(n_i, k_i) mod p sobre os dígitos
+# de n e k na base p. São O(log_p n) dígitos, o que permite n até 10^18 ou mais.
+def binomial_mod(n, k, p):
+    if not _primo(p) or p > LIMITE_PRIMO:
+        raise ValueError(f"p deve ser um número primo menor ou igual a {LIMITE_PRIMO}.")
+    if k < 0 or k > n:
+        return 0
+    resultado = 1
+    while n or k:
+        n_i, k_i = n % p, k % p
+        if k_i > n_i:
+            return 0
+        resultado = resultado * _binomial_digito_mod(n_i, k_i, p) % p
+        n, k = n // p, k // p
+    return resultado
+
+
+def termo_mod(a, b, n, k, p):
+    return binomial_mod(n, k, p) * pow(a, n - k, p) * pow(b, k, p) % p
+
+
+# inteiro·fator para um inteiro possivelmente acima de 1e308, sem convertê-lo inteiro para
+# float: só os 53 bits mais altos entram na multiplicação e o expoente binário volta por
+# ldexp. OverflowError apenas quando o próprio produto não cabe num float.
+def _multiplicar(inteiro, fator):
+    deslocamento = max(0, abs(inteiro).bit_length() - 53)
+    return math.ldexp((inteiro >> deslocamento) * fator, deslocamento)
+
+
+# log10 |C(n,k)|. Para k pequeno (após usar a simetria) soma os fatores do produto
+# multiplicativo; para k grande usa Stirling na forma k·ln(n/k) + (n-k)·ln(n/(n-k)) + ...,
+# sem subtrair lgammas quase iguais. Os logaritmos são tomados dos inteiros, nunca de
+# n convertido para float, para que n acima de 1e308 continue funcionando; o termo
+# (n-k)·ln(1 + k/(n-k)) é escrito como k·ln(1 + r)/r, com r = k/(n-k) ≤ 1.
+def log10_binomial(n, k):
+    k = min(k, n - k)
+    if k <= 10 ** 5:
+        return math.fsum(math.log10(n - i) - math.log10(i + 1) for i in range(k))
+    m = n - k
+    r = k / m
+    log1p_por_r = 1 - r / 2 if r < 1e-8 else math.log1p(r) / r
+    ln_n, ln_k, ln_m = math.log(n), math.log(k), math.log(m)
+    return (_multiplicar(k, (ln_n - ln_k + log1p_por_r) / math.log(10))
+            + (0.5 * (ln_n - ln_k - ln_m - math.log(2 * math.pi))
+               + 1 / (12 * n) - 1 / (12 * k) - 1 / (12 * m)) / math.log(10))
+
+
+def _log10_potencia(base, expoente):
+    return 0.0 if abs(base) == 1 or expoente == 0 else _multiplicar(expoente, math.log10(abs(base)))
+
+
+# Sinal e log10 do módulo do termo; None quando o termo é zero. ValueError quando o
+# próprio log10 não cabe num float (mais de ~1e308 dígitos).
+def magnitude_termo(a, b, n, k):
+    if k < 0 or k > n or (a == 0 and n - k > 0) or (b == 0 and k > 0):
+        return None
+    sinal = (-1 if a < 0 and (n - k) % 2 else 1) * (-1 if b < 0 and k % 2 else 1)
+    try:
+        log10 = log10_binomial(n, k) + _log10_potencia(a, n - k) + _log10_potencia(b, k)
+    except OverflowError:
+        raise ValueError("O termo tem mais de 10^308 dígitos; nem a magnitude cabe num número de ponto flutuante.") from None
+    return sinal, log10
+
+
+# Resumo exibível de um inteiro possivelmente enorme: o valor completo quando é curto;
+# caso contrário o número de dígitos, os primeiros dígitos (pelo log10) e os últimos
+# (por um resto), sem converter o número inteiro para texto.
+def resumo_inteiro(valor):
+    if valor == 0:
+        return {"valor": "0", "digitos": 1}
+    log10 = math.log10(abs(valor))
+    digitos = int(log10) + 1
+    if digitos <= DIGITOS_COMPLETOS:
+        return {"valor": str(valor), "digitos": len(str(abs(valor)))}
+    inicio = f"{10 ** (log10 - int(log10)):.12f}".replace(".", "")[:12]
+    fim = str(abs(valor) % 10 ** 12).zfill(12)
+    return {"valor": f"{'-' if valor < 0 else ''}{inicio}…{fim}", "digitos": digitos}
+
+
+def resumo_termo_exato(a, b, n, k):
+    return resumo_inteiro(termo_exato(a, b, n, k))
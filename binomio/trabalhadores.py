@@ -0,0 +1,183 @@
+import importlib
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from binomio.metricas import metricas
+
+# Módulos das funções enviadas ao pool. São importados assim que o processo nasce, antes
+# de ele se declarar pronto, para que nenhuma tarefa pague a importação de sympy/numpy.
+MODULOS_TRABALHADOR = ("binomio.nucleo", "binomio.termo_geral", "binomio.verificacao")
+
+# Um único thread para OpenBLAS/OpenMP nos trabalhadores: os buffers reservados por thread
+# crescem com o número de núcleos e, em máquinas grandes, estourariam o RLIMIT_AS logo na
+# importação do numpy. Os processos com spawn herdam o ambiente do servidor no momento
+# em que são criados, antes de qualquer importação no filho.
+VARIAVEIS_UM_THREAD = ("OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+class TempoEsgotado(Exception):
+    pass
+
+
+class TarefaCancelada(Exception):
+    pass
+
+
+def _laco_trabalhador(conexao, limite_memoria_mb):
+    if resource is not None and limite_memoria_mb:
+        limite = limite_memoria_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+    for nome in MODULOS_TRABALHADOR:
+        importlib.import_module(nome)
+    conexao.send(None)
+    while True:
+        tarefa = conexao.recv()
+        if tarefa is None:
+            return
+        func, args = tarefa
+        # As fases medidas aqui voltam junto com o resultado e são atribuídas, no
+        # processo do servidor, à página que pediu o cálculo.
+        metricas.iniciar_rerun()
+        try:
+            conexao.send((True, func(*args), metricas.medicoes_rerun()))
+        except MemoryError:
+            conexao.send((False, MemoryError("O cálculo excedeu o limite de memória."), []))
+        except Exception as erro:
+            conexao.send((False, erro, metricas.medicoes_rerun()))
+
+
+class _Trabalhador:
+    def __init__(self, contexto, limite_memoria_mb):
+        for nome in VARIAVEIS_UM_THREAD:
+            os.environ.setdefault(nome, "1")
+        self.conexao, conexao_filho = contexto.Pipe()
+        self.processo = contexto.Process(target=_laco_trabalhador, args=(conexao_filho, limite_memoria_mb),
+                                         daemon=True)
+        self.processo.start()
+        conexao_filho.close()
+        self.pronto = False
+
+    # Espera até `tempo` segundos o aviso de que as importações terminaram.
+    def aguardar_pronto(self, tempo):
+        if not self.pronto and self.conexao.poll(tempo):
+            self.conexao.recv()
+            self.pronto = True
+        return self.pronto
+
+    def encerrar(self):
+        self.processo.terminate()
+        self.processo.join()
+        self.conexao.close()
+
+
+# Executa trabalho simbólico (sympify, expand, latex) em processos separados, fora da
+# thread do script do Streamlit. Há no máximo `processos` trabalhadores; uma tarefa que
+# estoura o tempo limite ou é cancelada tem seu processo encerrado e substituído.
+# Uma nova tarefa com a mesma `chave` cancela a anterior ainda em andamento.
+# O tempo limite só começa a contar quando um trabalhador pronto recebe a tarefa; a espera
+# por um trabalhador livre (ou ainda iniciando) tem seu próprio limite, `tempo_espera`, e
+# não encerra nenhum processo.
+class PoolSimbolico:
+    def __init__(self, processos=2, tempo_limite=3.0, limite_memoria_mb=512, intervalo=0.05, tempo_espera=10.0):
+        self.processos = processos
+        self.tempo_limite = tempo_limite
+        self.tempo_espera = tempo_espera
+        self.limite_memoria_mb = limite_memoria_mb
+        self.intervalo = intervalo
+        self._contexto = multiprocessing.get_context("spawn")
+        self._livres = queue.Queue()
+        self._criados = 0
+        self._em_andamento = {}
+        self._lock = threading.Lock()
+
+    def _reservar(self, prazo):
+        with self._lock:
+            if self._livres.empty() and self._criados < self.processos:
+                self._criados += 1
+                return _Trabalhador(self._contexto, self.limite_memoria_mb)
+        try:
+            return self._livres.get(timeout=max(0.0, prazo - time.monotonic()))
+        except queue.Empty:
+            raise TempoEsgotado("Todos os processos de cálculo estão ocupados.") from None
+
+    # Encerra um trabalhador e, por padrão, já cria o substituto, que importa os módulos
+    # enquanto nenhuma tarefa espera por ele.
+    def _descartar(self, trabalhador, repor=True):
+        trabalhador.encerrar()
+        with self._lock:
+            self._criados -= 1
+        if repor:
+            self.aquecer()
+
+    # Cria de antemão todos os trabalhadores, sem esperar que fiquem prontos.
+    def aquecer(self):
+        with self._lock:
+            while self._criados < self.processos:
+                self._criados += 1
+                self._livres.put(_Trabalhador(self._contexto, self.limite_memoria_mb))
+
+    def executar(self, func, *args, chave=None, tempo_limite=None):
+        cancelado = threading.Event()
+        if chave is not None:
+            with self._lock:
+                anterior = self._em_andamento.get(chave)
+                if anterior is not None:
+                    anterior.set()
+                self._em_andamento[chave] = cancelado
+
+        try:
+            espera = time.monotonic() + self.tempo_espera
+            trabalhador = self._reservar(espera)
+            try:
+                while not trabalhador.aguardar_pronto(self.intervalo):
+                    if cancelado.is_set() or time.monotonic() >= espera:
+                        self._livres.put(trabalhador)
+                        if cancelado.is_set():
+                            raise TarefaCancelada("A tarefa foi substituída por uma mais recente.")
+                        raise TempoEsgotado("Os processos de cálculo ainda estão iniciando.")
+            except (EOFError, OSError):
+                self._descartar(trabalhador)
+                raise MemoryError("O processo de cálculo foi encerrado pelo sistema.") from None
+
+            prazo = time.monotonic() + (tempo_limite or self.tempo_limite)
+            trabalhador.conexao.send((func, args))
+            while not trabalhador.conexao.poll(self.intervalo):
+                if cancelado.is_set():
+                    self._descartar(trabalhador)
+                    raise TarefaCancelada("A tarefa foi substituída por uma mais recente.")
+                if time.monotonic() >= prazo:
+                    self._descartar(trabalhador)
+                    raise TempoEsgotado("O cálculo excedeu o tempo limite.")
+            try:
+                sucesso, resultado, medicoes = trabalhador.conexao.recv()
+            except (EOFError, OSError):
+                self._descartar(trabalhador)
+                raise MemoryError("O processo de cálculo foi encerrado pelo sistema.") from None
+            self._livres.put(trabalhador)
+        finally:
+            if chave is not None:
+                with self._lock:
+                    if self._em_andamento.get(chave) is cancelado:
+                        del self._em_andamento[chave]
+
+        for _, fase, segundos in medicoes:
+            metricas.registrar(fase, segundos)
+        if not sucesso:
+            raise resultado
+        return resultado
+
+    def encerrar(self):
+        while not self._livres.empty():
+            self._descartar(self._livres.get_nowait(), repor=False)
+
+
+# Instância única por processo do servidor; os trabalhadores são criados sob demanda.
+pool_simbolico = PoolSimbolico()
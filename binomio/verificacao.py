@@ -0,0 +1,110 @@
+import random
+import re
+from fractions import Fraction
+
+import sympy as sp
+
+TAMANHO_MAXIMO = 2000
+EXPOENTE_MAXIMO = 1000
+
+_POTENCIA = re.compile(r"\*\*|\^")
+# Expoente aceito: um inteiro literal que não é, ele próprio, base de outra potência.
+_EXPOENTE = re.compile(r"\s*[+-]?(\d+)(?!\d|\s*(?:\*\*|\^))")
+_TERMO = re.compile(r"([+-]?)(\d*)(\*?x(?:(?:\*\*|\^)(\d+))?)?")
+
+
+class RespostaMuitoGrande(ValueError):
+    pass
+
+
+# Rejeita, antes de qualquer parsing, respostas longas demais, expoentes literais acima
+# do limite (ex: x**100000) e qualquer expoente que não seja um inteiro literal, pois
+# x**(10**6), 9**9**9 ou x**(2*500000) só seriam avaliados depois do parsing.
+def validar_tamanho(texto):
+    if len(texto) > TAMANHO_MAXIMO:
+        raise RespostaMuitoGrande(f"A resposta tem mais de {TAMANHO_MAXIMO} caracteres.")
+    for potencia in _POTENCIA.finditer(texto):
+        expoente = _EXPOENTE.match(texto, potencia.end())
+        if expoente is None:
+            raise RespostaMuitoGrande("Os expoentes da resposta devem ser números inteiros (ex: x**2).")
+        if len(expoente.group(1)) > 6 or int(expoente.group(1)) > EXPOENTE_MAXIMO:
+            raise RespostaMuitoGrande(f"A resposta usa expoentes maiores que {EXPOENTE_MAXIMO}.")
+
+
+# Lê uma soma de monômios em x (ex: "4*x^2 - 12*x + 9") diretamente para {grau: coeficiente}.
+# Devolve None quando o texto tem qualquer outra forma, que fica para o sympy.
+def coeficientes_texto(texto):
+    texto = texto.replace(" ", "")
+    if not texto:
+        return None
+    coefs = {}
+    pos = 0
+    while pos < len(texto):
+        m = _TERMO.match(texto, pos)
+        sinal, numero, parte_x, expoente = m.groups()
+        if pos > 0 and not sinal:
+            return None
+        if not (numero or parte_x):
+            return None
+        if parte_x and (bool(numero) != parte_x.startswith("*")):
+            return None
+        grau = (int(expoente) if expoente else 1) if parte_x else 0
+        coef = int(numero) if numero else 1
+        coefs[grau] = coefs.get(grau, 0) + (-coef if sinal == "-" else coef)
+        pos = m.end()
+    return {grau: coef for grau, coef in coefs.items() if coef != 0}
+
+
+def _coeficientes_por_grau(coefs):
+    n = len(coefs) - 1
+    return {n - i: c for i, c in enumerate(coefs) if c != 0}
+
+
+def _horner(coefs, valor):
+    resultado = 0
+    for c in coefs:
+        resultado = resultado * valor + c
+    return resultado
+
+
+# Compara a resposta com o esperado avaliando ambos em pontos racionais aleatórios
+# exatos (Schwartz–Zippel): polinômios distintos de grau d coincidem num ponto
+# sorteado com probabilidade de no máximo d / (tamanho do conjunto de sorteio).
+# `esperado` é uma lista de coeficientes em x (do maior para o menor grau) ou uma
+# expressão do sympy.
+def comparar_por_avaliacao(esperado, texto, pontos=5, semente=None):
+    expr = sp.sympify(texto)
+    if isinstance(esperado, list):
+        simbolos = [sp.Symbol("x")]
+    else:
+        simbolos = sorted(esperado.free_symbols, key=str)
+    if not expr.free_symbols <= set(simbolos):
+        return False
+
+    rng = random.Random(semente)
+    for _ in range(pontos):
+        valores = {s: Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 6)) for s in simbolos}
+        ponto = {s: sp.Rational(v.numerator, v.denominator) for s, v in valores.items()}
+        if isinstance(esperado, list):
+            valor_esperado = _horner(esperado, valores[simbolos[0]])
+            valor_esperado = sp.Rational(valor_esperado.numerator, valor_esperado.denominator)
+        else:
+            valor_esperado = esperado.subs(ponto)
+        diferenca = expr.subs(ponto) - valor_esperado
+        if not diferenca.is_Number:
+            diferenca = sp.simplify(diferenca)
+        if diferenca != 0:
+            return False
+    return True
+
+
+# Verifica a resposta de um aluno. Com coeficientes esperados e resposta na forma de
+# soma de monômios, compara os vetores de coeficientes sem expandir nada; nos demais
+# casos recorre a `avaliar` (por padrão comparar_por_avaliacao).
+def verificar_resposta(esperado, texto, avaliar=None):
+    validar_tamanho(texto)
+    if isinstance(esperado, list):
+        monomios = coeficientes_texto(texto)
+        if monomios is not None:
+            return monomios == _coeficientes_por_grau(esperado)
+    return (avaliar or comparar_por_avaliacao)(esperado, texto)